@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark: impacted-test traversal over the dependency graph.
+
+Compares the multi-source BFS used by ``resolve_impacted_tests`` (a plain deque
+over the graph's successor view, stopping once every test is reached) against
+the previous approach of one ``nx.dfs_preorder_nodes`` walk per impacted module.
+
+The graph is either built from a real package or generated synthetically as a
+layered DAG, which makes it easy to scale the node count.
+
+Usage:
+    python benchmarks/bench_traversal.py
+    python benchmarks/bench_traversal.py --module my_package --tests-dir tests
+    python benchmarks/bench_traversal.py --synthetic 20000
+"""
+
+import argparse
+import os
+import random
+import time
+
+import networkx as nx
+
+from pytest_impacted.graph import _reachable_tests, _test_nodes, build_dep_tree
+from pytest_impacted.traversal import path_to_package_name
+
+
+def synthetic_dep_tree(n_modules: int, n_tests: int, fanout: int = 4, seed: int = 0) -> nx.DiGraph:
+    """Build a layered dependency tree: each module is imported by *fanout* later modules or tests."""
+    rng = random.Random(seed)
+    modules = [f"pkg.mod{i}" for i in range(n_modules)]
+    tests = [f"tests.test_mod{i}" for i in range(n_tests)]
+
+    dep_tree = nx.DiGraph()
+    dep_tree.add_nodes_from(modules)
+    dep_tree.add_nodes_from(tests)
+    for i, module in enumerate(modules):
+        later = modules[i + 1 :]
+        for dependent in rng.sample(later, min(fanout, len(later))):
+            dep_tree.add_edge(module, dependent)
+        for test in rng.sample(tests, min(fanout, len(tests))):
+            dep_tree.add_edge(module, test)
+    return dep_tree
+
+
+def bench_dfs_per_module(dep_tree: nx.DiGraph, sources: list[str], test_nodes: frozenset[str]) -> set[str]:
+    """One ``nx.dfs_preorder_nodes`` walk per impacted module (previous implementation)."""
+    impacted = set()
+    for source in sources:
+        impacted.update(node for node in nx.dfs_preorder_nodes(dep_tree, source) if node in test_nodes)
+    return impacted
+
+
+def bench_bfs_multi_source(dep_tree: nx.DiGraph, sources: list[str], test_nodes: frozenset[str]) -> set[str]:
+    """A single multi-source BFS over the successor view (current implementation)."""
+    return _reachable_tests(dep_tree, sources, test_nodes)
+
+
+def time_fn(fn, *args, iterations=3):
+    """Run a function multiple times and return the best time."""
+    times = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark impacted-test graph traversal")
+    parser.add_argument("--module", default="pytest_impacted", help="Module to benchmark (default: pytest_impacted)")
+    parser.add_argument("--tests-dir", default="tests", help="Tests directory (default: tests)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Use a synthetic graph with this many modules")
+    parser.add_argument("--sources", type=int, default=10, help="Number of changed modules to start from")
+    parser.add_argument("--iterations", type=int, default=5, help="Number of iterations per benchmark")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        dep_tree = synthetic_dep_tree(args.synthetic, n_tests=max(1, args.synthetic // 2))
+        print(f"Synthetic graph: {args.synthetic} modules")
+    else:
+        tests_package = None
+        if args.tests_dir and os.path.isdir(args.tests_dir):
+            tests_package = path_to_package_name(args.tests_dir)
+        dep_tree = build_dep_tree(args.module, tests_package=tests_package)
+        print(f"Module: {args.module}, Tests dir: {args.tests_dir}")
+
+    test_nodes = _test_nodes(dep_tree)
+    candidates = sorted(node for node in dep_tree.nodes if node not in test_nodes)
+    sources = random.Random(0).sample(candidates, min(args.sources, len(candidates)))
+
+    print(f"Graph: {dep_tree.number_of_nodes()} nodes, {dep_tree.number_of_edges()} edges, {len(test_nodes)} tests")
+    print(f"Sources: {len(sources)}, Iterations: {args.iterations}")
+    print()
+
+    dfs_time, dfs_result = time_fn(bench_dfs_per_module, dep_tree, sources, test_nodes, iterations=args.iterations)
+    print(f"  dfs_preorder_nodes per module: {dfs_time * 1000:8.2f} ms")
+    bfs_time, bfs_result = time_fn(bench_bfs_multi_source, dep_tree, sources, test_nodes, iterations=args.iterations)
+    print(f"  multi-source BFS:              {bfs_time * 1000:8.2f} ms")
+
+    print()
+    print(f"Speedup (BFS vs DFS): {dfs_time / bfs_time:.1f}x" if bfs_time else "Speedup (BFS vs DFS): n/a")
+    print("Results match." if dfs_result == bfs_result else "MISMATCH between DFS and BFS results!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 """pytest-impacted: selectively run tests impacted by code changes."""
 
-from pytest_impacted.extensions import ConfigOption, StrategyProtocol
-from pytest_impacted.graph import resolve_impacted_tests
-from pytest_impacted.parsing import parse_file_imports
-from pytest_impacted.strategies import ImpactStrategy
-from pytest_impacted.traversal import discover_submodules
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from pytest_impacted.extensions import ConfigOption, StrategyProtocol
+    from pytest_impacted.graph import resolve_impacted_tests
+    from pytest_impacted.parsing import parse_file_imports
+    from pytest_impacted.strategies import ImpactStrategy
+    from pytest_impacted.traversal import discover_submodules
 
 
 __all__ = [
@@ -15,3 +20,28 @@ __all__ = [
     "parse_file_imports",
     "resolve_impacted_tests",
 ]
+
+# Public names are resolved on first access (PEP 562). The pytest plugin imports this
+# package on every pytest run, and eagerly importing the graph/strategy modules would
+# pull NetworkX into runs that never pass --impacted.
+_EXPORTS = {
+    "ConfigOption": "pytest_impacted.extensions",
+    "ImpactStrategy": "pytest_impacted.strategies",
+    "StrategyProtocol": "pytest_impacted.extensions",
+    "discover_submodules": "pytest_impacted.traversal",
+    "parse_file_imports": "pytest_impacted.parsing",
+    "resolve_impacted_tests": "pytest_impacted.graph",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
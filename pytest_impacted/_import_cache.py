@@ -0,0 +1,149 @@
+"""On-disk cache of parsed imports, keyed by file path and stat signature.
+
+Parsing every source file on every run dominates plugin start-up, yet in an
+incremental workflow almost none of the files change between runs. This
+module persists the per-file import lists produced by
+:func:`~pytest_impacted.graph.build_dep_tree` so that subsequent runs only
+re-parse files whose ``(st_mtime_ns, st_size)`` changed. As in git's index,
+entries for files modified no earlier than the cache was written are not
+trusted, since a same-size edit within the timestamp granularity would leave
+the signature unchanged.
+
+The cache is a JSON document with a header that captures everything the parse
+result depends on besides the file contents (cache format, plugin version,
+Python version, parser backend and, for the Python backend, the set of known
+module names). Any header mismatch discards the whole cache; entries for files
+that are no longer part of the package are dropped on the next write. Read or write failures are logged and
+otherwise ignored — the cache is an optimization, never a source of truth.
+"""
+
+import contextlib
+import hashlib
+import importlib.metadata
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT_VERSION = 1
+
+# Type of a single cache entry: (st_mtime_ns, st_size, module_name, imports).
+CacheEntry = tuple[int, int, str, list[str]]
+
+
+def _plugin_version() -> str:
+    try:
+        return importlib.metadata.version("pytest-impacted")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cache_file_path(cache_dir: Path, package: str, tests_package: str | None) -> Path:
+    """Return the cache file used for a given package / tests package combination.
+
+    Each combination gets its own file so that alternating between
+    configurations does not keep invalidating a shared cache.
+    """
+    key = hashlib.sha256(f"{package}\0{tests_package or ''}".encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"imports-{key}.json"
+
+
+def cache_header(module_names, backend: str) -> dict[str, Any]:
+    """Build the header that a cache file must match to be reused.
+
+    For the Python backend the set of module names is part of the header:
+    resolving ``from pkg import name`` depends on whether ``pkg.name`` is a
+    module, so adding or removing a module can change the result for unchanged
+    files. The Rust backend reports both candidates and leaves the filtering to
+    the graph builder, so its results do not depend on the module set and
+    adding a file does not discard the cache.
+    """
+    header: dict[str, Any] = {
+        "format": _CACHE_FORMAT_VERSION,
+        "plugin": _plugin_version(),
+        "python": sys.version,
+        "backend": backend,
+    }
+    if backend == "python":
+        header["modules"] = hashlib.sha256("\n".join(sorted(module_names)).encode()).hexdigest()
+    return header
+
+
+def stat_signature(file_path: str) -> tuple[int, int] | None:
+    """Return ``(st_mtime_ns, st_size)`` for *file_path*, or ``None`` if it cannot be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_cache(path: Path, header: dict[str, Any]) -> dict[str, CacheEntry]:
+    """Load cache entries from *path* if its header matches *header*.
+
+    Returns an empty dict when the file is missing, unreadable, corrupt or
+    was written for a different environment. Malformed entries are dropped, as
+    are "racily clean" ones whose mtime is not older than the cache file itself:
+    a same-size edit landing within the filesystem's timestamp granularity of
+    the cache write would otherwise keep its stale stat signature.
+    """
+    try:
+        with open(path, encoding="utf-8") as fh:
+            written_ns = os.fstat(fh.fileno()).st_mtime_ns
+            data = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.debug("Ignoring unreadable import cache %s", path, exc_info=True)
+        return {}
+
+    if not isinstance(data, dict) or data.get("header") != header:
+        logger.debug("Import cache %s was written for a different environment; ignoring it.", path)
+        return {}
+
+    raw_entries = data.get("entries")
+    if not isinstance(raw_entries, dict):
+        return {}
+
+    entries: dict[str, CacheEntry] = {}
+    for file_path, entry in raw_entries.items():
+        try:
+            mtime_ns, size, module_name, imports = entry
+        except (TypeError, ValueError):
+            continue
+        if not (
+            isinstance(mtime_ns, int)
+            and isinstance(size, int)
+            and isinstance(module_name, str)
+            and isinstance(imports, list)
+            and all(isinstance(name, str) for name in imports)
+        ):
+            continue
+        if mtime_ns >= written_ns:
+            continue
+        entries[file_path] = (mtime_ns, size, module_name, imports)
+    return entries
+
+
+def save_cache(path: Path, header: dict[str, Any], entries: dict[str, CacheEntry]) -> None:
+    """Atomically write *entries* to *path* under *header*.
+
+    The document is written to a temporary sibling file and then moved into
+    place, so concurrent runs (e.g. pytest-xdist workers) never observe a
+    partially written cache.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"header": header, "entries": entries}, fh, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug("Failed to write import cache %s", path, exc_info=True)
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
@@ -19,8 +19,34 @@ from pytest_impacted.traversal import (
 
 
 def matches_impacted_tests(item_path: str, *, impacted_tests: list[str]) -> bool:
-    """Check if the item path matches any of the impacted tests."""
-    return any(test == item_path or test.endswith(os.sep + item_path) for test in impacted_tests)
+    """Check if the item path matches any of the impacted tests.
+
+    An impacted test matches when it equals *item_path* or ends with it at a path
+    separator boundary, so ``foo.py`` never matches ``something_foo.py``. To match
+    many items against the same impacted tests, use :func:`build_impacted_tests_index`.
+    """
+    needle = os.sep + item_path
+    return any(test == item_path or test.endswith(needle) for test in impacted_tests)
+
+
+def build_impacted_tests_index(impacted_tests: list[str]) -> frozenset[str]:
+    """Build a lookup set for matching many item paths against *impacted_tests*.
+
+    The index holds every impacted test path plus each of its suffixes that
+    starts right after a path separator, so ``item_path in index`` is
+    equivalent to :func:`matches_impacted_tests` but costs a single hash
+    lookup instead of a scan over all impacted tests. Impacted paths are
+    normalized once here, so item paths (already normalized by pytest) never
+    need to be.
+    """
+    index: set[str] = set()
+    for test in map(os.path.normpath, impacted_tests):
+        index.add(test)
+        pos = test.find(os.sep)
+        while pos != -1:
+            index.add(test[pos + 1 :])
+            pos = test.find(os.sep, pos + 1)
+    return frozenset(index)
 
 
 def get_impacted_tests(
@@ -32,8 +58,13 @@ def get_impacted_tests(
     session=None,
     strategy: ImpactStrategy | None = None,
     watch_dep_files: bool = True,
+    cache_dir: Path | None = None,
 ) -> list[str] | None:
-    """Get the list of impacted tests based on the git state and static analysis."""
+    """Get the list of impacted tests based on the git state and static analysis.
+
+    If *cache_dir* is given, parsed imports are persisted there between runs
+    so that only files changed since the previous run are re-parsed.
+    """
     git_mode = impacted_git_mode
     base_branch = impacted_base_branch
 
@@ -75,7 +106,7 @@ def get_impacted_tests(
     # The result is LRU-cached and must not be mutated, so we hand each run a
     # shallow copy. Strategies that implement enrich_dep_tree() mutate the
     # copy, leaving the cached base graph pristine for subsequent runs.
-    dep_tree = cached_build_dep_tree(ns_module, tests_package=tests_package).copy()
+    dep_tree = cached_build_dep_tree(ns_module, tests_package=tests_package, cache_dir=cache_dir).copy()
 
     # Enrichment phase — runs before setup so that setup and find_impacted_tests
     # both see the final graph (with any synthetic edges added by extensions).
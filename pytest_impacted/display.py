@@ -3,10 +3,21 @@
 import logging
 
 
+def _terminal_reporter(session):
+    """Return the session's terminal reporter, or ``None`` without a session or reporter.
+
+    The reporter is missing when pytest runs with ``-p no:terminal``.
+    """
+    if not session:
+        return None
+    return session.config.pluginmanager.getplugin("terminalreporter")
+
+
 def notify(message: str, session) -> None:
     """Print a message to the console."""
-    if session:
-        session.config.pluginmanager.getplugin("terminalreporter").write(
+    reporter = _terminal_reporter(session)
+    if reporter is not None:
+        reporter.write(
             f"\n{message}\n",
             yellow=True,
             bold=True,
@@ -17,8 +28,9 @@ def notify(message: str, session) -> None:
 
 def warn(message: str, session) -> None:
     """Print a warning message to the console."""
-    if session:
-        session.config.pluginmanager.getplugin("terminalreporter").write(
+    reporter = _terminal_reporter(session)
+    if reporter is not None:
+        reporter.write(
             f"\nWARNING: {message}\n",
             yellow=True,
             bold=True,
@@ -1,18 +1,22 @@
 """Git related functions."""
 
+import importlib.util
+import os
 import warnings
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 
-try:
+if TYPE_CHECKING:
     from git import Repo
     from git.diff import Diff
 
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
+
+# GitPython is a sizeable import chain, and this module is imported whenever the
+# plugin is installed. Only probe for it here; it is imported on first use.
+GIT_AVAILABLE = importlib.util.find_spec("git") is not None
+if not GIT_AVAILABLE:
     warnings.warn(
         "GitPython package is not available. Git-related functionality will be disabled. "
         "To enable git functionality, install GitPython and ensure git CLI is available.",
@@ -61,6 +65,9 @@ class GitStatus(StrEnum):
 # Statuses that indicate a file is impactful for test coverage.
 _IMPACTFUL_STATUSES = (GitStatus.MODIFIED, GitStatus.ADDED, GitStatus.RENAMED, GitStatus.COPIED)
 
+# ``XY`` codes of unmerged paths in ``git status --porcelain`` output (see ``man git-status``).
+_UNMERGED_PORCELAIN_STATUSES = frozenset({"DD", "AU", "UD", "UA", "DU", "AA", "UU"})
+
 
 class Change:
     """A change to a git repository file."""
@@ -118,7 +125,7 @@ class ChangeSet:
         return "\n".join(str(change) for change in self.changes)
 
     @classmethod
-    def from_diff_objs(cls, diffs: list[Diff]) -> "ChangeSet":
+    def from_diff_objs(cls, diffs: list["Diff"]) -> "ChangeSet":
         """Create a ChangeSet from a list of git diff objects."""
         changes = []
         for diff in diffs:
@@ -155,13 +162,56 @@ class ChangeSet:
         changes = [Change.from_git_diff_name_status(status=status, name=name) for (status, name) in diffs]
         return cls(changes)
 
+    @classmethod
+    def from_git_status_porcelain_output(cls, status_str: str) -> "ChangeSet":
+        """Create a ChangeSet of working tree changes from `git status --porcelain=v1 -z`.
+
+        Only the working tree column (``Y`` of ``XY``) is considered, which is what
+        ``git diff`` (working tree vs. index) reports; untracked files (``??``) are
+        reported as added and unmerged paths (``DD``, ``AU``, ``UD``, ``UA``, ``DU``,
+        ``AA``, ``UU``) are skipped. A rename or copy entry is followed by an extra
+        entry holding the original path.
+
+        Example input (NUL-separated)::
+
+            " M setup.py\0R  new.py\0old.py\0?? notes.py\0"
+
+        """
+        entries = status_str.split("\0")
+        changes = []
+        i = 0
+        while i < len(entries):
+            entry = entries[i]
+            i += 1
+            if len(entry) < 4:
+                continue
+            index_status, worktree_status, path = entry[0], entry[1], entry[3:]
+            orig_path = None
+            if index_status in "RC" or worktree_status in "RC":
+                orig_path = entries[i] if i < len(entries) else None
+                i += 1
+
+            if entry[:2] in _UNMERGED_PORCELAIN_STATUSES:
+                continue
+            if index_status == worktree_status == "?":
+                changes.append(Change(a_path=path, b_path=None, status=GitStatus.ADDED))
+            elif worktree_status in "RC":
+                changes.append(
+                    Change(a_path=orig_path, b_path=path, status=GitStatus.from_git_diff_name_status(worktree_status))
+                )
+            elif worktree_status != " ":
+                changes.append(
+                    Change(a_path=path, b_path=None, status=GitStatus.from_git_diff_name_status(worktree_status))
+                )
+        return cls(changes)
+
 
 def without_nones(items: list[Any | None]) -> list[Any]:
     """Remove all Nones from the list."""
     return [item for item in items if item is not None]
 
 
-def describe_index_diffs(diffs: list[Diff]) -> None:
+def describe_index_diffs(diffs: list["Diff"]) -> None:
     """Describe the index diffs to stdout."""
     for diff in diffs:
         print(f"diff: {str(diff)}")
@@ -174,6 +224,8 @@ def find_repo(path: str | Path) -> "Repo":
     at the exact git root — essential for monorepo layouts where the Python
     project lives in a subdirectory.
     """
+    from git import Repo  # noqa: PLC0415
+
     return Repo(path=Path(path), search_parent_directories=True)
 
 
@@ -190,14 +242,20 @@ def normalize_git_paths(file_paths: list[str], git_root: Path, working_dir: Path
     if git_root == working_dir:
         return file_paths  # Fast path: no conversion needed
 
+    # Plain string prefix checks instead of Path.relative_to(), which builds several Path
+    # objects per file and signals "outside working_dir" by raising ValueError.
+    root = str(git_root)
+    prefix = os.path.join(str(working_dir), "")  # working dir with exactly one trailing separator
+    prefix_len = len(prefix)
+
     result: list[str] = []
     for file_path in file_paths:
-        abs_path = git_root / file_path
-        try:
-            result.append(str(abs_path.relative_to(working_dir)))
-        except ValueError:
+        abs_path = os.path.normpath(os.path.join(root, file_path))
+        if abs_path.startswith(prefix):
+            result.append(abs_path[prefix_len:])
+        else:
             # File is outside the working directory — use absolute path
-            result.append(str(abs_path))
+            result.append(abs_path)
     return result
 
 
@@ -262,27 +320,27 @@ def _collect_paths_for_change(item: Change) -> list[str | None]:
     return [item.name]
 
 
-def impacted_files_for_unstaged_mode(repo: Repo) -> list[str] | None:
-    """Get the impacted files when in the UNSTAGED git mode."""
-    if not repo.is_dirty(untracked_files=True):
-        return None
+def impacted_files_for_unstaged_mode(repo: "Repo") -> list[str] | None:
+    """Get the impacted files when in the UNSTAGED git mode.
 
-    diffs = repo.index.diff(None)
-    change_set = ChangeSet.from_diff_objs(diffs)
+    A single ``git status --porcelain=v1 -z`` call reports both the working tree
+    changes and the untracked files, instead of building a GitPython ``Diff``
+    object per change and then listing untracked files in a second call.
+    """
+    status = repo.git.status(porcelain="v1", z=True, untracked_files="all")
+    # Nb. untracked files are included (as added) as they are also
+    # potentially impactful for unit-test coverage.
+    change_set = ChangeSet.from_git_status_porcelain_output(status)
 
     impacted_files = []
     for item in change_set.changes:
         if item.status in _IMPACTFUL_STATUSES:
             impacted_files.extend(_collect_paths_for_change(item))
 
-    # Nb. we also include untracked files as they are also
-    # potentially impactful for unit-test coverage.
-    impacted_files.extend(repo.untracked_files)
-
     return without_nones(impacted_files) or None
 
 
-def impacted_files_for_branch_mode(repo: Repo, base_branch: str) -> list[str] | None:
+def impacted_files_for_branch_mode(repo: "Repo", base_branch: str) -> list[str] | None:
     """Get the impacted files when in the BRANCH git mode."""
 
     try:
@@ -1,20 +1,55 @@
 """Graph analysis functionality."""
 
 import logging
+import os
+import sys
 import types
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 import networkx as nx
 
+from pytest_impacted import _import_cache
 from pytest_impacted._rust import RUST_AVAILABLE
-from pytest_impacted.parsing import is_test_module, parse_file_imports
+from pytest_impacted.parsing import clear_module_path_cache, is_test_module, parse_file_imports, parse_imports_task
 from pytest_impacted.traversal import discover_submodules
 
 
+# Private graph attribute under which build_dep_tree caches ``(all_nodes, test_nodes)``.
+_TEST_NODES_KEY = "_test_nodes"
+
+# Environment variable overriding the number of worker processes used by the Python parsing fallback.
+# Set to 1 (or 0) to force sequential parsing.
+WORKERS_ENV_VAR = "PYTEST_IMPACTED_WORKERS"
+
+# Below this many files, process start-up costs more than parsing sequentially. Under the
+# ``spawn`` start method (macOS, Windows) every worker is a fresh interpreter, so the pool
+# only pays off once there is a substantial amount of parsing to spread out.
+_PARALLEL_PARSE_THRESHOLD = 100
+
+
+def _parse_worker_count(num_tasks: int) -> int:
+    """Return how many worker processes to use for *num_tasks* files (1 means sequential)."""
+    if num_tasks < _PARALLEL_PARSE_THRESHOLD:
+        return 1
+
+    requested = os.environ.get(WORKERS_ENV_VAR)
+    if requested:
+        try:
+            return max(1, min(int(requested), num_tasks))
+        except ValueError:
+            logging.warning("Ignoring invalid %s=%r; expected an integer.", WORKERS_ENV_VAR, requested)
+
+    return max(1, min(os.cpu_count() or 1, num_tasks))
+
+
 def _parse_all_module_imports(submodules: dict[str, str]) -> dict[str, list[str]]:
     """Parse imports for all discovered submodules.
 
-    Uses the Rust extension (parallel batch via rayon) when available,
-    falling back to sequential astroid parsing.
+    Uses the Rust extension (parallel batch via rayon) when available. Otherwise
+    falls back to stdlib ``ast`` parsing, spread over a process pool for larger packages
+    (see :data:`WORKERS_ENV_VAR`) and sequential for small ones.
     """
     if RUST_AVAILABLE:
         from pytest_impacted._rust import rust_parse_all_imports  # noqa: PLC0415
@@ -22,70 +57,182 @@ def _parse_all_module_imports(submodules: dict[str, str]) -> dict[str, list[str]
         modules_info = [(path, name, path.endswith("__init__.py")) for name, path in submodules.items()]
         return rust_parse_all_imports(modules_info)
 
+    tasks = [(name, path, path.endswith("__init__.py")) for name, path in submodules.items()]
+
+    workers = _parse_worker_count(len(tasks))
+    if workers > 1:
+        logging.debug("Parsing %d submodules with %d worker processes", len(tasks), workers)
+        chunksize = max(1, len(tasks) // (4 * workers))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return dict(executor.map(parse_imports_task, tasks, chunksize=chunksize))
+        except (OSError, RuntimeError):
+            # Process pools are unavailable in some sandboxes; BrokenProcessPool is a RuntimeError.
+            logging.warning("Parallel import parsing failed; falling back to sequential parsing.", exc_info=True)
+
     result: dict[str, list[str]] = {}
-    for name, file_path in submodules.items():
+    for name, path, is_pkg in tasks:
         logging.debug("Processing submodule: %s", name)
-        is_pkg = file_path.endswith("__init__.py")
-        result[name] = parse_file_imports(file_path, name, is_package=is_pkg)
+        result[name] = parse_file_imports(path, name, is_package=is_pkg)
+    return result
+
+
+def _parse_all_module_imports_cached(submodules: dict[str, str], cache_path: Path) -> dict[str, list[str]]:
+    """Parse imports for all submodules, reusing results cached at *cache_path*.
+
+    Files whose ``(st_mtime_ns, st_size)`` match the cached entry are not read
+    at all; only the misses are handed to :func:`_parse_all_module_imports`.
+    Files are stat'ed *before* parsing, so a file modified mid-run is simply
+    re-parsed next time. The cache is rewritten once, and only when it changed.
+    """
+    header = _import_cache.cache_header(submodules, backend="rust" if RUST_AVAILABLE else "python")
+    cached = _import_cache.load_cache(cache_path, header)
+
+    result: dict[str, list[str]] = {}
+    entries: dict[str, _import_cache.CacheEntry] = {}
+    misses: dict[str, str] = {}
+    signatures: dict[str, tuple[int, int]] = {}
+    for name, file_path in submodules.items():
+        signature = _import_cache.stat_signature(file_path)
+        entry = cached.get(file_path)
+        if signature is not None and entry is not None and (entry[0], entry[1], entry[2]) == (*signature, name):
+            result[name] = entry[3]
+            entries[file_path] = entry
+            continue
+        misses[name] = file_path
+        if signature is not None:
+            signatures[name] = signature
+
+    logging.debug("Import cache: %d hits, %d misses", len(result), len(misses))
+
+    if misses:
+        parsed = _parse_all_module_imports(misses)
+        for name, file_path in misses.items():
+            imports = parsed.get(name, [])
+            result[name] = imports
+            if name in signatures:
+                entries[file_path] = (*signatures[name], name, imports)
+
+    if misses or len(entries) != len(cached):
+        _import_cache.save_cache(cache_path, header, entries)
+
     return result
 
 
+def _reachable_tests(dep_tree: nx.DiGraph, sources, test_nodes: frozenset[str]) -> set[str]:
+    """Return the test nodes reachable from *sources* (inclusive) in a single multi-source BFS.
+
+    Test hits are collected while traversing, and the walk stops as soon as every
+    test node has been reached — nothing further can be added at that point.
+
+    Indexes the public ``succ`` adjacency view directly rather than going through
+    :meth:`networkx.DiGraph.successors`, which builds an iterator for every
+    visited node. The view works for graph views (subgraphs, reversed graphs) too.
+    """
+    succ = dep_tree.succ
+    visited = set(sources)
+    found = visited & test_nodes
+    remaining = len(test_nodes) - len(found)
+    queue = deque(visited)
+    while queue and remaining:
+        node = queue.popleft()
+        for successor in succ[node]:
+            if successor not in visited:
+                visited.add(successor)
+                queue.append(successor)
+                if successor in test_nodes:
+                    found.add(successor)
+                    remaining -= 1
+    return found
+
+
+def _test_nodes(dep_tree: nx.DiGraph) -> frozenset[str]:
+    """Return the test modules in *dep_tree*.
+
+    Uses the set precomputed by :func:`build_dep_tree` when it is still valid.
+    Graph attributes survive ``DiGraph.copy()``, so the cache is checked against
+    the full node set: graphs whose nodes changed after construction (e.g. via
+    ``ImpactStrategy.enrich_dep_tree`` or an in-place relabel) or that were built
+    by hand fall back to a fresh scan. Comparing the sets only hashes each node,
+    which is still cheaper than classifying every name again.
+    """
+    cached = dep_tree.graph.get(_TEST_NODES_KEY)
+    if cached is not None and dep_tree.nodes == cached[0]:
+        return cached[1]
+    return frozenset(node for node in dep_tree.nodes if is_test_module(node))
+
+
 def resolve_impacted_tests(impacted_modules, dep_tree: nx.DiGraph) -> list[str]:
     """Resolve impacted tests based on impacted modules.
 
-    The current logic is to do a DFS from the impacted module to find all nodes that depend on it.
-    We then check if these nodes are test modules.
+    The current logic is to do a single breadth-first traversal seeded with all impacted modules
+    to find every node that depends on any of them.
+    We then check which of these nodes are test modules.
     We return the list of test modules that are impacted.
 
     For modules not found in the dependency tree (e.g. outside the analyzed package scope):
     - Test modules are included directly as impacted (they changed, so they should run).
     - Production modules cause ALL test modules to be marked as impacted,
-      erring on the side of caution per project philosophy.
+      erring on the side of caution per project philosophy. The traversal is
+      skipped entirely in that case, since it could not add anything.
 
     """
-    impacted_tests = []
-    all_test_modules_in_tree = [node for node in dep_tree.nodes if is_test_module(node)]
+    test_nodes = _test_nodes(dep_tree)
+
+    impacted_tests: set[str] = set()
+    sources = []
+    all_marked = False
+    # Several changed files often resolve to the same module; handle each module once
+    # (keeping first-seen order so warnings stay in input order).
+    for module in dict.fromkeys(impacted_modules):
+        if module in dep_tree:
+            sources.append(module)
+            continue
 
-    for module in impacted_modules:
-        if module not in dep_tree.nodes:
+        logging.warning(
+            "Module %s is marked as impacted but was not found in dependency tree "
+            "(possibly outside the analyzed package scope).",
+            module,
+        )
+        if is_test_module(module):
+            # Test module changed but not in tree — include it directly.
+            impacted_tests.add(module)
+        else:
+            # Production module changed but not in tree — conservatively
+            # mark all known test modules as impacted.
             logging.warning(
-                "Module %s is marked as impacted but was not found in dependency tree "
-                "(possibly outside the analyzed package scope).",
+                "Production module %s not in dependency tree; conservatively marking all test modules as impacted.",
                 module,
             )
-            if is_test_module(module):
-                # Test module changed but not in tree — include it directly.
-                impacted_tests.append(module)
-            else:
-                # Production module changed but not in tree — conservatively
-                # mark all known test modules as impacted.
-                logging.warning(
-                    "Production module %s not in dependency tree; conservatively marking all test modules as impacted.",
-                    module,
-                )
-                impacted_tests.extend(all_test_modules_in_tree)
-            continue
-
-        dependent_nodes = [node for node in nx.dfs_preorder_nodes(dep_tree, source=module) if is_test_module(node)]
-
-        impacted_tests.extend(dependent_nodes)
+            all_marked = True
 
-    # Remove duplicates and sort the list for good measure.
-    # (although the order of the tests should not matter)
-    impacted_tests = sorted(list(set(impacted_tests)))
+    if all_marked:
+        # Every test is already impacted; a traversal could not add anything.
+        impacted_tests.update(test_nodes)
+    else:
+        impacted_tests.update(_reachable_tests(dep_tree, sources, test_nodes))
 
-    return impacted_tests
+    # Sort the result for good measure (although the order of the tests should not matter).
+    return sorted(impacted_tests)
 
 
-def build_dep_tree(package: str | types.ModuleType, tests_package: str | types.ModuleType | None = None) -> nx.DiGraph:
+def build_dep_tree(
+    package: str | types.ModuleType,
+    tests_package: str | types.ModuleType | None = None,
+    cache_dir: Path | None = None,
+) -> nx.DiGraph:
     """Build a dependency tree using filesystem discovery (no imports).
 
     Scans the package directory to find modules, reads their source files,
     and parses imports via AST — without executing any module-level code.
+
+    When *cache_dir* is given, per-file import lists are persisted there and
+    reused on later calls for files whose mtime and size are unchanged.
     """
     pkg_name = package if isinstance(package, str) else package.__name__
     submodules = discover_submodules(pkg_name, require_init=True)
 
+    tests_name = None
     if tests_package:
         tests_name = tests_package if isinstance(tests_package, str) else tests_package.__name__
         logging.debug("Adding modules from tests_package: %s", tests_name)
@@ -94,21 +241,36 @@ def build_dep_tree(package: str | types.ModuleType, tests_package: str | types.M
 
     logging.debug("Building dependency tree for %d submodules", len(submodules))
 
-    # Parse imports — Rust parallel path or Python sequential fallback
-    all_imports = _parse_all_module_imports(submodules)
-
-    digraph = nx.DiGraph()
-    for name in submodules:
-        digraph.add_node(name)
-        for imp in all_imports.get(name, []):
-            if imp in submodules:
-                digraph.add_node(imp)
-                digraph.add_edge(name, imp)
-
-    # The dependency graph is the reverse of the import graph, so invert it before returning.
-    inverted_digraph = inverted(digraph)
-
-    return inverted_digraph
+    # Modules may have been added or removed since the last build; resolve names afresh.
+    clear_module_path_cache()
+
+    # Parse imports — Rust parallel path or Python sequential fallback, optionally via the on-disk cache
+    if cache_dir is not None:
+        cache_path = _import_cache.cache_file_path(cache_dir, pkg_name, tests_name)
+        all_imports = _parse_all_module_imports_cached(submodules, cache_path)
+    else:
+        all_imports = _parse_all_module_imports(submodules)
+
+    # Collect edges into a plain adjacency mapping first and hand them to networkx in bulk.
+    # Per-call add_node/add_edge re-validates and re-looks-up both endpoints for every edge.
+    # Import names from the Rust backend or the on-disk cache are fresh strings; interning
+    # them maps each back onto the (already interned) discovered module name.
+    imports_of: dict[str, set[str]] = {
+        name: {sys.intern(imp) for imp in all_imports.get(name, ()) if imp in submodules} for name in submodules
+    }
+
+    # The dependency graph is the reverse of the import graph, so insert every edge as
+    # imported -> importer directly rather than building the import graph and inverting it.
+    dep_tree = nx.DiGraph()
+    dep_tree.add_nodes_from(imports_of)
+    dep_tree.add_edges_from((imp, name) for name, deps in imports_of.items() for imp in deps)
+
+    # Test-module classification is a pure function of the node name, so compute it once here
+    # instead of on every resolve_impacted_tests call.
+    test_nodes = frozenset(node for node in dep_tree.nodes if is_test_module(node))
+    dep_tree.graph[_TEST_NODES_KEY] = (frozenset(dep_tree.nodes), test_nodes)
+
+    return dep_tree
 
 
 def display_digraph(digraph: nx.DiGraph) -> None:
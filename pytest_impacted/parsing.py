@@ -1,14 +1,14 @@
 """Python code parsing (AST) utilities."""
 
+import ast
 import importlib.util
 import logging
-import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import astroid
-from astroid.nodes import Import, ImportFrom
-
 
 class _ModuleProxy:
     """Lightweight stand-in for a real module object.
@@ -66,7 +66,7 @@ def normalize_path(path_like: Any) -> Path:
         raise ValueError(f"Cannot normalize path-like object {path_like!r} of type {type(path_like)}") from e
 
 
-def _resolve_relative_import(module: _ModuleProxy, node: ImportFrom) -> str:
+def _resolve_relative_import(module: _ModuleProxy, node: ast.ImportFrom) -> str:
     """Resolve a relative import to its absolute module path.
 
     Args:
@@ -97,15 +97,15 @@ def _resolve_relative_import(module: _ModuleProxy, node: ImportFrom) -> str:
         base_package = ".".join(base_package_parts) if base_package_parts else ""
 
     # Resolve the module name
-    if node.modname:
+    if node.module:
         # from .module import something
-        return f"{base_package}.{node.modname}" if base_package else node.modname
+        return f"{base_package}.{node.module}" if base_package else node.module
     else:
         # from . import something
         return base_package
 
 
-def _extract_imports_from_node(node: Import | ImportFrom, module: _ModuleProxy) -> set[str]:
+def _extract_imports_from_node(node: ast.Import | ast.ImportFrom, module: _ModuleProxy) -> set[str]:
     """Extract import module names from an AST node.
 
     Args:
@@ -117,16 +117,16 @@ def _extract_imports_from_node(node: Import | ImportFrom, module: _ModuleProxy)
     """
     imports = set()
 
-    if isinstance(node, Import):
-        for name in node.names:
-            imports.add(name[0])
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            imports.add(alias.name)
 
-    elif isinstance(node, ImportFrom):
-        resolved_modname = _resolve_relative_import(module, node) if node.level and node.level > 0 else node.modname
+    elif isinstance(node, ast.ImportFrom):
+        resolved_modname = _resolve_relative_import(module, node) if node.level else (node.module or "")
 
         # Check if imported names are modules or just symbols
-        for name, *_ in node.names:
-            full_name = f"{resolved_modname}.{name}" if resolved_modname else name
+        for alias in node.names:
+            full_name = f"{resolved_modname}.{alias.name}" if resolved_modname else alias.name
             if is_module_path(full_name, package=module.__name__):
                 imports.add(full_name)
             else:
@@ -135,12 +135,37 @@ def _extract_imports_from_node(node: Import | ImportFrom, module: _ModuleProxy)
     return imports
 
 
+# Statement attributes that hold nested statement lists (compound statement bodies).
+_BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _collect_imports(tree: ast.Module, module: _ModuleProxy) -> set[str]:
+    """Collect the modules imported anywhere in *tree*.
+
+    Import statements can only appear in statement lists, so the walk follows
+    compound-statement bodies (``if TYPE_CHECKING:``, ``try``/``except``,
+    ``with``, loops, ``match``, functions and classes) and never visits
+    expression nodes, which make up most of a typical module's AST.
+    """
+    imports: set[str] = set()
+    stack: list[ast.AST] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import | ast.ImportFrom):
+            imports.update(_extract_imports_from_node(node, module))
+            continue
+        for field in _BODY_FIELDS:
+            # except handlers and match cases are not statements themselves but carry a body.
+            stack.extend(getattr(node, field, ()))
+    return imports
+
+
 def parse_file_imports(file_path: str, module_name: str, is_package: bool = False) -> list[str]:
     """Parse imports from a source file without importing the module.
 
-    Reads the file directly and uses a :class:`_ModuleProxy` to supply the
-    module metadata required for relative-import resolution.  This avoids
-    executing any module-level code.
+    Reads the file directly and hands its contents to :func:`parse_source_imports`,
+    which uses a :class:`_ModuleProxy` to supply the module metadata required for
+    relative-import resolution.  This avoids executing any module-level code.
 
     Args:
         file_path: Absolute path to the ``.py`` file.
@@ -150,36 +175,71 @@ def parse_file_imports(file_path: str, module_name: str, is_package: bool = Fals
     Returns:
         Sorted list of imported module names (absolute paths).
     """
+    # Read raw bytes: ast.parse decodes them itself (honouring any PEP 263 coding
+    # declaration), which saves decoding the source into a str first.
     try:
-        source = Path(file_path).read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        if os.path.exists(file_path) and os.stat(file_path).st_size == 0:
-            return []
+        with open(file_path, "rb") as fh:
+            source = fh.read()
+    except OSError:
         logging.error("Error reading file %s", file_path)
         return []
 
-    if not source.strip():
+    return parse_source_imports(source, module_name, is_package=is_package, filename=file_path)
+
+
+def parse_source_imports(
+    source: str | bytes,
+    module_name: str,
+    is_package: bool = False,
+    filename: str = "<unknown>",
+) -> list[str]:
+    """Parse imports from in-memory source code, as :func:`parse_file_imports` does for a file.
+
+    Args:
+        source: Module source, either decoded or as raw bytes.
+        module_name: Fully-qualified module name (e.g. ``"pkg.sub.mod"``).
+        is_package: ``True`` when the source is that of an ``__init__.py``.
+        filename: Name used in syntax-error messages.
+
+    Returns:
+        Sorted list of imported module names (absolute paths).
+    """
+    # Every import statement contains the keyword, so sources without it cannot
+    # contribute edges and need not be parsed at all.
+    has_import = b"import" in source if isinstance(source, bytes) else "import" in source
+    if not has_import:
         return []
 
     module_proxy = _ModuleProxy(module_name, is_package=is_package)
 
     try:
-        tree = astroid.parse(source)
-    except astroid.exceptions.AstroidSyntaxError:
-        logging.warning("Syntax error while parsing %s", file_path)
+        tree = ast.parse(source, filename=filename)
+    except (SyntaxError, ValueError):
+        # Undecodable sources surface here as a SyntaxError too.
+        logging.warning("Syntax error while parsing %s", filename)
         return []
 
-    imports: set[str] = set()
-    for node in tree.nodes_of_class((Import, ImportFrom)):
-        imports.update(_extract_imports_from_node(node, module_proxy))
+    return [sys.intern(name) for name in sorted(_collect_imports(tree, module_proxy))]
 
-    return sorted(imports)
+
+def parse_imports_task(task: tuple[str, str, bool]) -> tuple[str, list[str]]:
+    """Parse a single ``(module_name, file_path, is_package)`` task for a worker process.
+
+    Defined in this module rather than in :mod:`pytest_impacted.graph` so that
+    workers started with the ``spawn`` method import only the parser, not NetworkX.
+    """
+    name, file_path, is_pkg = task
+    return name, parse_file_imports(file_path, name, is_package=is_pkg)
 
 
 def is_module_path(module_path: str, package: str | None = None) -> bool:
     """
     Checks if a given string represents a valid module path.
 
+    Results are memoized (see :func:`clear_module_path_cache`): the same names are
+    looked up for nearly every file of a package, and each uncached lookup walks
+    the import path.
+
     Args:
         module_path: The string representing the module path (e.g., "pkg.foo.bar").
         package: The package to search for the module in. used for relative imports.
@@ -187,6 +247,13 @@ def is_module_path(module_path: str, package: str | None = None) -> bool:
     Returns:
         True if the path points to a module, False otherwise.
     """
+    # find_spec only consults *package* for relative names; dropping it otherwise lets
+    # lookups of the same absolute name from different modules share a cache entry.
+    return _is_module_path(module_path, package if module_path.startswith(".") else None)
+
+
+@lru_cache(maxsize=8192)
+def _is_module_path(module_path: str, package: str | None) -> bool:
     try:
         spec = importlib.util.find_spec(module_path, package=package)
         return spec is not None
@@ -209,6 +276,16 @@ def is_module_path(module_path: str, package: str | None = None) -> bool:
         return False
 
 
+def clear_module_path_cache() -> None:
+    """Forget memoized :func:`is_module_path` results, e.g. after modules were added or removed."""
+    _is_module_path.cache_clear()
+
+
+# A single scan over the dotted name: a ``test``/``tests`` component anywhere, or a
+# last component that starts with ``test_`` or ends with ``_test``.
+_TEST_MODULE_RE = re.compile(r"(?:^|\.)(?:tests?(?:\.|$)|test_[^.]*$)|_test$")
+
+
 def is_test_module(module_name: str) -> bool:
     """Check if a module is a test module using naming conventions.
 
@@ -223,16 +300,6 @@ def is_test_module(module_name: str) -> bool:
     Returns:
         True if the module appears to be a test module
     """
-    module_parts = module_name.split(".")
-    last_part = module_parts[-1] if module_parts else ""
-
-    # Check naming patterns
-    is_test = (
-        last_part.startswith("test_")
-        or last_part.endswith("_test")
-        or "test" in module_parts
-        or "tests" in module_parts
-    )
-
-    logging.debug("Module %s is a test module: %s", module_name, is_test)
-    return is_test
+    # No per-call debug logging: this runs once per graph node, and even a disabled
+    # logging.debug call costs about as much as the regex search itself.
+    return _TEST_MODULE_RE.search(module_name) is not None
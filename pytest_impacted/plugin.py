@@ -5,7 +5,6 @@ from typing import Any
 import pytest
 from pytest import Config, Parser, UsageError
 
-from pytest_impacted.api import get_impacted_tests, matches_impacted_tests
 from pytest_impacted.extensions import (
     build_strategy_with_extensions,
     discover_extension_metadata,
@@ -15,6 +14,26 @@ from pytest_impacted.extensions import (
 from pytest_impacted.git import GIT_AVAILABLE, GitMode, find_repo
 
 
+_GIT_MODE_CHOICES = tuple(GitMode.__members__.values())
+
+# Built-in options read by the hooks below, resolved once per session in pytest_configure.
+_OPTION_NAMES = (
+    "impacted",
+    "impacted_module",
+    "impacted_git_mode",
+    "impacted_base_branch",
+    "impacted_tests_dir",
+    "no_impacted_dep_files",
+    "no_impacted_cache",
+    "impacted_disable_ext",
+)
+_OPTIONS_KEY = pytest.StashKey[dict[str, Any]]()
+
+# Markers applied to every collected item, built once rather than per item.
+_IMPACTED_MARK = pytest.mark.impacted
+_SKIP_MARK = pytest.mark.skip
+
+
 def pytest_addoption(parser: Parser):
     """pytest hook to add command line options.
 
@@ -52,7 +71,7 @@ def pytest_addoption(parser: Parser):
         "--impacted-git-mode",
         action="store",
         dest="impacted_git_mode",
-        choices=GitMode.__members__.values(),
+        choices=_GIT_MODE_CHOICES,
         default=None,
         nargs="?",
         help="Git reference for computing impacted files.",
@@ -105,6 +124,20 @@ def pytest_addoption(parser: Parser):
         default=False,
     )
 
+    group.addoption(
+        "--no-impacted-cache",
+        action="store_true",
+        default=None,
+        dest="no_impacted_cache",
+        help="Do not reuse or store parsed imports in pytest's cache directory (forces a full re-parse).",
+    )
+    parser.addini(
+        "no_impacted_cache",
+        type="bool",
+        help="default value for --no-impacted-cache",
+        default=False,
+    )
+
     # Extension management
     group.addoption(
         "--impacted-disable-ext",
@@ -143,21 +176,29 @@ def pytest_configure(config: Config):
     This is called after the command line options have been parsed.
 
     """
-    validate_config(config)
-
     config.addinivalue_line(
         "markers",
         "impacted(state): mark test as impacted by the state of the git repository",
     )
 
+    # Nothing else to do for runs that do not use the plugin.
+    enabled = get_option_from_config(config, "impacted")
+    if not enabled:
+        return
+
+    options = {name: get_option_from_config(config, name) for name in _OPTION_NAMES if name != "impacted"}
+    options["impacted"] = enabled
+    validate_config(config, options)
+    config.stash[_OPTIONS_KEY] = options
+
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_report_header(config: Config) -> list[str]:
     """Add pytest-impacted config to pytest header."""
     from pytest_impacted._rust import RUST_AVAILABLE  # noqa: PLC0415
 
-    get_option = partial(get_option_from_config, config)
-    backend = "rust (ruff parser + rayon)" if RUST_AVAILABLE else "python (astroid)"
+    get_option = _impacted_options(config).get
+    backend = "rust (ruff parser + rayon)" if RUST_AVAILABLE else "python (ast)"
     ext_names = [e.name for e in discover_extension_metadata()]
     header = [
         f"impacted_module={get_option('impacted_module')}",
@@ -165,6 +206,7 @@ def pytest_report_header(config: Config) -> list[str]:
         f"impacted_base_branch={get_option('impacted_base_branch')}",
         f"impacted_tests_dir={get_option('impacted_tests_dir')}",
         f"no_impacted_dep_files={get_option('no_impacted_dep_files')}",
+        f"no_impacted_cache={get_option('no_impacted_cache')}",
         f"backend={backend}",
     ]
     if ext_names:
@@ -181,11 +223,15 @@ def pytest_collection_modifyitems(session, config, items):
     they are run.
 
     """
-    get_option = partial(get_option_from_config, config)
+    get_option = _impacted_options(config).get
     impacted = get_option("impacted")
     if not impacted:
         return
 
+    # Imported here so that runs without --impacted never load the analysis
+    # modules (and NetworkX with them).
+    from pytest_impacted.api import build_impacted_tests_index, get_impacted_tests  # noqa: PLC0415
+
     ns_module = get_option("impacted_module")
     impacted_git_mode = get_option("impacted_git_mode")
     impacted_base_branch = get_option("impacted_base_branch")
@@ -201,6 +247,11 @@ def pytest_collection_modifyitems(session, config, items):
         ext_config=ext_config,
     )
 
+    # Persist parsed imports in pytest's cache directory (absent under ``-p no:cacheprovider``).
+    cache_dir = None
+    if not get_option("no_impacted_cache") and getattr(config, "cache", None) is not None:
+        cache_dir = config.cache.mkdir("pytest-impacted")
+
     impacted_tests = get_impacted_tests(
         impacted_git_mode=impacted_git_mode,
         impacted_base_branch=impacted_base_branch,
@@ -209,19 +260,24 @@ def pytest_collection_modifyitems(session, config, items):
         tests_dir=impacted_tests_dir,
         session=session,
         strategy=strategy,
+        cache_dir=cache_dir,
     )
     if not impacted_tests:
         # skip all tests
         for item in items:
-            item.add_marker(pytest.mark.skip)
+            item.add_marker(_SKIP_MARK)
         return
 
+    # Index the impacted paths once so matching each collected item is a set lookup,
+    # rather than a scan over all impacted tests per item.
+    impacted_index = build_impacted_tests_index(impacted_tests)
+    impacted_mark, skip_mark = _IMPACTED_MARK, _SKIP_MARK
+    # ``item.location`` is a cached property that pytest computes for every item anyway
+    # (run-test logging reads it), so using it here adds no work. The nodeid prefix is
+    # not equivalent: it is "/"-separated and names the collecting file rather than
+    # the file defining the test.
     for item in items:
-        item_path = item.location[0]
-        if matches_impacted_tests(item_path, impacted_tests=impacted_tests):
-            item.add_marker(pytest.mark.impacted)
-        else:
-            item.add_marker(pytest.mark.skip)
+        item.add_marker(impacted_mark if item.location[0] in impacted_index else skip_mark)
 
 
 def get_option_from_config(config: Config, name: str) -> str | None:
@@ -234,19 +290,45 @@ def get_option_from_config(config: Config, name: str) -> str | None:
     return config.getoption(name) or config.getini(name)
 
 
-def validate_config(config: Config):
-    """Validate the configuration options."""
-    get_option = partial(get_option_from_config, config)
+def _impacted_options(config: Config) -> dict[str, Any]:
+    """Return the resolved built-in options, reusing the snapshot taken in pytest_configure.
+
+    The snapshot only exists when the plugin is enabled; otherwise (or when a hook
+    is called directly, as in unit tests) the options are resolved on the spot.
+    """
+    options = config.stash.get(_OPTIONS_KEY, None)
+    if options is None:
+        options = {name: get_option_from_config(config, name) for name in _OPTION_NAMES}
+    return options
+
+
+# Options that must be set when --impacted is on, checked in order: (option name,
+# git mode the option is required for or None if always required, error message).
+_REQUIRED_OPTIONS: tuple[tuple[str, GitMode | None, str], ...] = (
+    ("impacted_module", None, "No module specified. Please specify a module using --impacted-module."),
+    ("impacted_git_mode", None, "No git mode specified. Please specify a git mode using --impacted-git-mode."),
+    (
+        "impacted_base_branch",
+        GitMode.BRANCH,
+        "No base branch specified. Please specify a base branch using --impacted-base-branch.",
+    ),
+)
+
+
+def validate_config(config: Config, options: dict[str, Any] | None = None):
+    """Validate the configuration options.
+
+    *options* are the already-resolved built-in options; when omitted they are
+    read from *config*.
+    """
+    get_option = options.get if options is not None else partial(get_option_from_config, config)
     if not get_option("impacted"):
         return
 
-    if not get_option("impacted_module"):
-        raise UsageError("No module specified. Please specify a module using --impacted-module.")
-    if not get_option("impacted_git_mode"):
-        raise UsageError("No git mode specified. Please specify a git mode using --impacted-git-mode.")
-
-    if get_option("impacted_git_mode") == GitMode.BRANCH and not get_option("impacted_base_branch"):
-        raise UsageError("No base branch specified. Please specify a base branch using --impacted-base-branch.")
+    git_mode = get_option("impacted_git_mode")
+    for name, required_for_mode, message in _REQUIRED_OPTIONS:
+        if (required_for_mode is None or git_mode == required_for_mode) and not get_option(name):
+            raise UsageError(message)
 
     module_name = get_option("impacted_module")
     assert module_name is not None  # guarded by the check above
@@ -256,8 +338,9 @@ def validate_config(config: Config):
     if tests_dir:
         validate_tests_dir(tests_dir)
 
-    base_branch = get_option("impacted_base_branch")
-    if get_option("impacted_git_mode") == GitMode.BRANCH and base_branch:
+    if git_mode == GitMode.BRANCH:
+        base_branch = get_option("impacted_base_branch")
+        assert base_branch is not None  # guarded by the check above
         validate_base_branch(base_branch, str(config.rootdir))  # type: ignore[attr-defined]
 
 
@@ -328,10 +411,11 @@ def validate_base_branch(base_branch: str, root_dir: str) -> None:
     except GitCommandError as err:
         # List available local branches for the suggestion
         try:
-            branches = [ref.name for ref in repo.references]
-            branch_list = ", ".join(sorted(branches)[:10])
+            # repo.references re-reads packed-refs and walks .git/refs on every access.
+            branches = sorted(ref.name for ref in repo.references)
+            branch_list = ", ".join(branches[:10])
             suffix = f" Available refs: {branch_list}"
-            if len(repo.references) > 10:
+            if len(branches) > 10:
                 suffix += ", ..."
         except (AttributeError, TypeError):
             suffix = ""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+import os
 from abc import ABC, abstractmethod
 from functools import lru_cache
 from pathlib import Path, PurePosixPath
@@ -13,8 +14,9 @@ if TYPE_CHECKING:
 
 import networkx as nx
 
+from pytest_impacted._import_cache import stat_signature
 from pytest_impacted.graph import build_dep_tree, resolve_impacted_tests
-from pytest_impacted.parsing import is_test_module, normalize_path
+from pytest_impacted.parsing import clear_module_path_cache, is_test_module, normalize_path
 from pytest_impacted.traversal import discover_submodules
 
 
@@ -61,35 +63,88 @@ def has_dependency_file_changes(
     return any(matches_dependency_file(f, patterns, glob_patterns) for f in changed_files)
 
 
+def _tree_fingerprint(ns_module: str, tests_package: str | None) -> tuple[Any, ...]:
+    """Return the state of the source tree that a cached dependency tree was built from.
+
+    Package names are resolved relative to the working directory, the discovery
+    fingerprints change whenever a module is added to or removed from any
+    directory of the package (see ``discover_submodules.fingerprint``), and the
+    per-file ``(st_mtime_ns, st_size)`` signatures change when an existing module
+    is edited, which can change its imports without touching any directory.
+    """
+    fingerprints = [os.getcwd(), discover_submodules.fingerprint(ns_module, require_init=True)]
+    files = list(discover_submodules(ns_module, require_init=True).values())
+    if tests_package:
+        fingerprints.append(discover_submodules.fingerprint(tests_package, require_init=False))
+        files.extend(discover_submodules(tests_package, require_init=False).values())
+    return (*fingerprints, tuple(map(stat_signature, files)))
+
+
 @lru_cache(maxsize=8)
-def cached_build_dep_tree(ns_module: str, tests_package: str | None = None) -> nx.DiGraph:
-    """Cached version of build_dep_tree to avoid redundant graph construction.
+def _build_dep_tree_for(
+    ns_module: str,
+    tests_package: str | None,
+    cache_dir: Path | None,
+    fingerprint: tuple[Any, ...],
+) -> nx.DiGraph:
+    return build_dep_tree(ns_module, tests_package=tests_package, cache_dir=cache_dir)
 
-    Args:
-        ns_module: The namespace module being analyzed
-        tests_package: Optional tests package name
 
-    Returns:
-        NetworkX dependency graph
+class _CachedDepTreeBuilder:
+    """Cached version of build_dep_tree to avoid redundant graph construction.
+
+    Called as ``cached_build_dep_tree(ns_module, tests_package=None, cache_dir=None)``
+    and, like a ``functools.lru_cache`` function, exposes ``cache_clear()`` and
+    ``cache_info()``.
 
     Note:
         Using LRU cache with maxsize=8 to cache recent dependency trees while
         preventing unbounded memory growth. This optimizes the common case where
         the same ns_module/tests_package combination is used repeatedly within
-        a single pytest run.
+        a single pytest run. Entries are also keyed on :func:`_tree_fingerprint`
+        (the working directory, the mtimes of every scanned directory and the
+        stat signature of every module file), so a long-lived process
+        (``--looponfail``, repeated pytester runs in different directories)
+        rebuilds the tree once modules are added, removed or edited instead of
+        reusing a stale one.
     """
-    return build_dep_tree(ns_module, tests_package=tests_package)
+
+    def __call__(self, ns_module: str, tests_package: str | None = None, cache_dir: Path | None = None) -> nx.DiGraph:
+        """Return the (possibly cached) dependency tree.
+
+        Args:
+            ns_module: The namespace module being analyzed
+            tests_package: Optional tests package name
+            cache_dir: Optional directory for the persistent per-file import cache
+
+        Returns:
+            NetworkX dependency graph
+        """
+        return _build_dep_tree_for(ns_module, tests_package, cache_dir, _tree_fingerprint(ns_module, tests_package))
+
+    def cache_clear(self) -> None:
+        """Drop all cached dependency trees (see also :func:`clear_dep_tree_cache`)."""
+        _build_dep_tree_for.cache_clear()
+
+    def cache_info(self) -> Any:
+        """Return the ``functools.lru_cache`` statistics of the tree cache."""
+        return _build_dep_tree_for.cache_info()
+
+
+cached_build_dep_tree = _CachedDepTreeBuilder()
 
 
 def clear_dep_tree_cache() -> None:
     """Clear the dependency tree cache.
 
     This is useful for testing or when you want to ensure fresh analysis
-    after code changes during development. Also clears discovery caches
-    since stale submodule data would produce stale dependency trees.
+    after code changes during development. Also clears the discovery and
+    module-lookup caches since stale submodule data would produce stale
+    dependency trees.
     """
-    cached_build_dep_tree.cache_clear()
+    _build_dep_tree_for.cache_clear()
     discover_submodules.cache_clear()
+    clear_module_path_cache()
 
 
 class ImpactStrategy(ABC):
@@ -275,8 +330,7 @@ class PytestImpactStrategy(ImpactStrategy):
         conftest_impacted_tests = self._find_conftest_impacted_tests(changed_files, root_dir, dep_tree)
 
         # Combine and deduplicate
-        all_impacted = list(set(impacted_tests + conftest_impacted_tests))
-        return sorted(all_impacted)
+        return sorted({*impacted_tests, *conftest_impacted_tests})
 
     def _find_conftest_impacted_tests(
         self, changed_files: list[str], root_dir: Path | None, dep_tree: nx.DiGraph
@@ -289,8 +343,7 @@ class PytestImpactStrategy(ImpactStrategy):
         if not conftest_files:
             return []
 
-        impacted_tests: list[str] = []
-
+        conftest_dirs: list[Path] = []
         for conftest_file in conftest_files:
             try:
                 conftest_path = normalize_path(conftest_file)
@@ -298,47 +351,49 @@ class PytestImpactStrategy(ImpactStrategy):
                 if not conftest_path.is_absolute():
                     conftest_path = normalize_path(root_dir) / conftest_path
 
-                conftest_dir = conftest_path.parent
+                # Resolved once per conftest rather than once per candidate test module.
+                conftest_dirs.append(conftest_path.parent.resolve())
             except ValueError:
                 # Skip files that can't be normalized to valid paths
                 continue
 
-            # Find all test modules in subdirectories that could be affected
-            impacted_tests.extend(
-                test_module
-                for test_module in dep_tree.nodes
-                if is_test_module(test_module)
-                and self._is_test_affected_by_conftest(test_module, conftest_dir, root_dir)
-            )
+        if not conftest_dirs:
+            return []
 
-        return impacted_tests
+        # Find all test modules in subdirectories that could be affected. Each module's
+        # file is located (and resolved) once, however many conftest files changed.
+        root_path = normalize_path(root_dir)
+        return [
+            test_module
+            for test_module in dep_tree.nodes
+            if is_test_module(test_module)
+            and any(
+                path.is_relative_to(conftest_dir)
+                for path in self._resolved_module_paths(test_module, root_path)
+                for conftest_dir in conftest_dirs
+            )
+        ]
 
     def _is_test_affected_by_conftest(self, test_module: str, conftest_dir: Path, root_dir: Path) -> bool:
         """Check if a test module is affected by a conftest.py change."""
-        # Convert module name to file path
-        module_parts = test_module.split(".")
+        # Check if the test file is in the same directory or a subdirectory
+        # of where the conftest.py was changed
+        resolved_conftest_dir = conftest_dir.resolve()
+        return any(
+            path.is_relative_to(resolved_conftest_dir)
+            for path in self._resolved_module_paths(test_module, normalize_path(root_dir))
+        )
 
-        # Try to find the actual file path for this test module
-        module_path = "/".join(module_parts)
-        root_path = normalize_path(root_dir)
+    @staticmethod
+    def _resolved_module_paths(test_module: str, root_path: Path) -> list[Path]:
+        """Return the resolved paths of the files under *root_path* that could hold *test_module*."""
+        # Convert module name to file path
+        module_path = test_module.replace(".", "/")
         possible_paths = [
             root_path / (module_path + ".py"),
             root_path / module_path / "__init__.py",
         ]
-
-        # Check if any of the possible paths exist and are affected by conftest
-        for path in possible_paths:
-            if path.exists():
-                try:
-                    # Check if the test file is in the same directory or a subdirectory
-                    # of where the conftest.py was changed
-                    path.resolve().relative_to(conftest_dir.resolve())
-                    return True
-                except ValueError:
-                    # path is not relative to conftest_dir
-                    continue
-
-        return False
+        return [path.resolve() for path in possible_paths if path.exists()]
 
 
 class DependencyFileImpactStrategy(ImpactStrategy):
@@ -515,7 +570,7 @@ class CompositeImpactStrategy(ImpactStrategy):
         Passes the shared ``dep_tree`` to all sub-strategies so the expensive
         graph construction happens only once in the pipeline.
         """
-        all_impacted = []
+        all_impacted: set[str] = set()
 
         for strategy in self.strategies:
             strategy_results = strategy.find_impacted_tests(
@@ -527,7 +582,6 @@ class CompositeImpactStrategy(ImpactStrategy):
                 session=session,
                 dep_tree=dep_tree,
             )
-            all_impacted.extend(strategy_results)
+            all_impacted.update(strategy_results)
 
-        # Remove duplicates and sort
-        return sorted(list(set(all_impacted)))
+        return sorted(all_impacted)
@@ -1,11 +1,15 @@
 """Python package and module traversal utilities."""
 
 import logging
+import operator
 import os
 import pkgutil
+import sys
 import types
-from functools import lru_cache
+from collections.abc import Callable
+from functools import partial, update_wrapper
 from pathlib import Path
+from typing import NamedTuple
 
 
 def package_name_to_path(package_name: str) -> str:
@@ -76,80 +80,223 @@ def iter_namespace(ns_package: str | types.ModuleType, *, scan_path: str | None
     return module_infos
 
 
-def _discover_via_pkgutil(package: str) -> dict[str, str]:
-    """Discover submodules using pkgutil (requires __init__.py in directories).
+# (directory, st_mtime_ns or None) recorded for each directory a discovery result depends on.
+_DirStamp = tuple[str, int | None]
+
+
+def _dir_stamp(path: str) -> _DirStamp:
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return path, None
+
+
+def _discover_via_scandir(package: str, watched: list[_DirStamp] | None = None) -> dict[str, str]:
+    """Discover submodules of an importable package (requires __init__.py in directories).
+
+    Follows the same rules as :func:`pkgutil.iter_modules` applied recursively, but
+    in a single iterative ``os.scandir`` walk that builds module names and paths
+    from the directory entries directly.
 
     Handles src-layout projects by detecting non-package prefix directories
     (e.g. ``src/``) and stripping them from module names while keeping them
     in filesystem paths.
     """
     fs_path = package_name_to_path(package)
-    non_pkg_prefix, importable_path = find_non_package_prefix(fs_path)
+    _, importable_path = find_non_package_prefix(fs_path)
     importable_name = path_to_package_name(importable_path)
-    return _discover_pkgutil_impl(importable_name, fs_path, non_pkg_prefix)
+    return _scan_package_tree(importable_name, os.path.abspath(fs_path), watched)
+
 
+def _scan_package_tree(module_name: str, scan_path: str, watched: list[_DirStamp] | None = None) -> dict[str, str]:
+    """Walk *scan_path* iteratively and map every submodule of *module_name* to its file.
 
-def _discover_pkgutil_impl(module_name: str, scan_path: str, non_pkg_prefix: str) -> dict[str, str]:
-    """Recursive implementation of pkgutil-based submodule discovery.
+    Mirrors :func:`pkgutil.iter_modules`: ``.py`` files and directories containing an
+    ``__init__.py`` are modules, names containing a ``.`` are skipped, and a package
+    takes precedence over a same-named ``.py`` file. The package itself is not included.
+    ``DirEntry.is_dir()`` / ``is_file()`` reuse the information gathered by ``scandir``,
+    so only the ``__init__.py`` probe of each candidate sub-package costs an extra stat.
 
     Args:
         module_name: Dotted importable module name used as prefix (e.g. ``"predicated"``).
-        scan_path: Filesystem path to scan (e.g. ``"src/predicated"``).
-        non_pkg_prefix: Non-package path prefix to prepend when constructing file paths
-            (e.g. ``"src"``).  Empty string when there is no prefix.
+        scan_path: Absolute filesystem path to scan (e.g. ``"/repo/src/predicated"``).
+        watched: If given, receives a stamp for every directory whose entries the result
+            depends on: each scanned directory and each probed directory lacking an
+            ``__init__.py`` (creating one there only changes that directory's mtime).
     """
     results: dict[str, str] = {}
-    for module_info in iter_namespace(module_name, scan_path=scan_path):
-        name = module_info.name
-        if name not in results:
-            # Construct file path: prepend the non-package prefix to module parts
-            module_parts = name.split(".")
-            file_parts = list(Path(non_pkg_prefix).parts) + module_parts if non_pkg_prefix else module_parts
-
-            if module_info.ispkg:
-                file_path = os.path.join(*file_parts, "__init__.py")
-            else:
-                file_path = os.path.join(*file_parts) + ".py"
-
-            abs_path = os.path.abspath(file_path)
-            if os.path.exists(abs_path):
-                results[name] = abs_path
-            else:
-                logging.warning("Module %s not found at expected path %s", name, abs_path)
-
-            if module_info.ispkg:
-                sub_scan_path = os.path.join(scan_path, module_parts[-1])
-                results.update(_discover_pkgutil_impl(name, sub_scan_path, non_pkg_prefix))
+    stack = [(scan_path, f"{module_name}.")]
+    while stack:
+        dir_path, prefix = stack.pop()
+        if watched is not None:
+            # Stamp before listing, so a change made mid-scan invalidates the result.
+            watched.append(_dir_stamp(dir_path))
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            logging.debug("Cannot scan directory %s", dir_path)
+            continue
+
+        subpackages = []
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".py"):
+                stem = name[:-3]
+                if stem == "__init__" or "." in stem or not entry.is_file():
+                    continue
+                # A package of the same name shadows the module, as in the import system.
+                results.setdefault(sys.intern(prefix + stem), entry.path)
+            elif "." not in name and entry.is_dir():
+                init_path = os.path.join(entry.path, "__init__.py")
+                if os.path.isfile(init_path):
+                    results[sys.intern(prefix + name)] = init_path
+                    subpackages.append((entry.path, f"{prefix}{name}."))
+                elif watched is not None:
+                    watched.append(_dir_stamp(entry.path))
+
+        # Push in reverse so sub-packages are walked in name order.
+        stack.extend(reversed(subpackages))
 
     return results
 
 
-def _discover_via_filesystem(package: str) -> dict[str, str]:
+def _discover_via_filesystem(package: str, watched: list[_DirStamp] | None = None) -> dict[str, str]:
     """Discover submodules by walking the filesystem (no __init__.py required).
 
-    Uses Path.rglob to find all .py files regardless of whether intermediate
-    directories contain __init__.py. This matches pytest's own filesystem-based
-    test discovery behavior.
+    Finds all .py files regardless of whether intermediate directories contain
+    __init__.py. This matches pytest's own filesystem-based test discovery behavior.
+    Like ``Path.rglob``, the walk does not descend into symlinked directories; it
+    uses ``os.scandir`` directly so that file types come from the directory listing
+    and the base directory is resolved once rather than once per file. Every scanned
+    directory is stamped into *watched*, if given.
     """
     base_path = Path(package_name_to_path(package))
     if not base_path.is_dir():
         return {}
 
+    base_dir = os.path.realpath(base_path)
     results: dict[str, str] = {}
-    for py_file in base_path.rglob("*.py"):
-        rel = py_file.relative_to(base_path.parent)
-        if py_file.name == "__init__.py":
-            module_name = ".".join(rel.parent.parts)
-        else:
-            module_name = ".".join(rel.with_suffix("").parts)
+    stack = [(base_dir, base_path.name)]
+    while stack:
+        dir_path, dir_module = stack.pop()
+        if watched is not None:
+            watched.append(_dir_stamp(dir_path))
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            logging.debug("Cannot scan directory %s", dir_path)
+            continue
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".py") and entry.is_file():
+                module_name = dir_module if name == "__init__.py" else f"{dir_module}.{name[:-3]}"
+                # Only symlinked files can still need resolving below the resolved base.
+                results[sys.intern(module_name)] = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+            elif name != "__pycache__" and entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, f"{dir_module}.{name}"))
 
-        abs_path = str(py_file.resolve())
-        results[module_name] = abs_path
+        # Sub-directories are walked after the files beside them, as rglob does.
+        stack.extend(reversed(subdirs))
 
     return results
 
 
-@lru_cache
+class _CacheInfo(NamedTuple):
+    """Cache statistics, shaped like those of :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class _DirectoryMtimeCache:
+    """Memoize a discovery function on its arguments and the mtimes of the directories it scanned.
+
+    Drop-in replacement for ``functools.lru_cache`` (including ``cache_clear()``
+    and ``cache_info()``) that re-scans once any directory the result was built
+    from changes, so long-lived processes do not keep serving a stale module list.
+    A directory's mtime only changes when entries are added, removed or renamed
+    directly in it, which is exactly what discovery depends on at that level, so
+    validating a cached result costs one ``stat`` per directory instead of a full
+    re-scan. Results are produced by *scan*, which takes the wrapped function's
+    arguments plus a list it appends those directory stamps to; the wrapped function
+    itself only supplies the public signature and docstring and serves roots that
+    cannot be stat'ed, which are never cached.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[str, bool], dict[str, str]],
+        *,
+        scan: Callable[[str, bool, list[_DirStamp]], dict[str, str]],
+    ):
+        update_wrapper(self, func)
+        self._func = func
+        self._scan = scan
+        # (package, require_init, absolute root) -> (root st_mtime_ns, directory stamps, result)
+        self._entries: dict[tuple[str, bool, str], tuple[int, tuple[_DirStamp, ...], dict[str, str]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, package: str, require_init: bool = True) -> dict[str, str]:
+        entry = self._lookup(package, require_init)
+        return entry[2] if entry is not None else self._func(package, require_init)
+
+    def _lookup(self, package: str, require_init: bool) -> tuple[int, tuple[_DirStamp, ...], dict[str, str]] | None:
+        """Return the up-to-date cache entry for the arguments, scanning if needed (``None`` if uncacheable)."""
+        root = os.path.abspath(package_name_to_path(package))
+        try:
+            mtime_ns = os.stat(root).st_mtime_ns
+        except OSError:
+            self._misses += 1
+            return None
+
+        key = (package, require_init, root)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == mtime_ns and all(_dir_stamp(stamp[0]) == stamp for stamp in cached[1]):
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        watched: list[_DirStamp] = []
+        result = self._scan(package, require_init, watched)
+        entry = (mtime_ns, tuple(watched), result)
+        self._entries[key] = entry
+        return entry
+
+    def fingerprint(self, package: str, require_init: bool = True) -> tuple[int, tuple[_DirStamp, ...]] | None:
+        """Return the directory stamps the current result for the arguments was validated against.
+
+        Equal fingerprints mean :meth:`__call__` returns the same result, which lets
+        caches built on top of discovery (e.g. the dependency-tree cache) follow it.
+        """
+        entry = self._lookup(package, require_init)
+        return entry[:2] if entry is not None else None
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the statistics."""
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+    def cache_info(self) -> _CacheInfo:
+        """Return hit/miss statistics and the number of cached results."""
+        return _CacheInfo(self._hits, self._misses, None, len(self._entries))
+
+
+def _discover_submodules_uncached(package: str, require_init: bool, watched: list[_DirStamp]) -> dict[str, str]:
+    """Scan *package* for :func:`discover_submodules`, stamping every directory the result depends on into *watched*."""
+    if require_init:
+        return _discover_via_scandir(package, watched)
+    else:
+        return _discover_via_filesystem(package, watched)
+
+
+@partial(_DirectoryMtimeCache, scan=_discover_submodules_uncached)
 def discover_submodules(package: str, require_init: bool = True) -> dict[str, str]:
     """Discover all submodules by filesystem scanning, without importing them.
 
@@ -169,32 +316,63 @@ def discover_submodules(package: str, require_init: bool = True) -> dict[str, st
     Returns:
         Dict mapping fully-qualified module name -> absolute file path.
     """
-    if require_init:
-        return _discover_via_pkgutil(package)
-    else:
-        return _discover_via_filesystem(package)
+    return _discover_submodules_uncached(package, require_init, [])
+
+
+# (ns_module, tests_package) -> (discovery results the index was built from, index).
+_MODULE_INDEXES: dict[
+    tuple[str, str | None], tuple[tuple[dict[str, str], ...], tuple[dict[str, str], dict[str, str]]]
+] = {}
+
+
+def _module_index(ns_module: str, tests_package: str | None = None) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the ``({module_name: abs_path}, {abs_path: module_name})`` maps for *ns_module* (and *tests_package*).
+
+    Both directions are built together, once, and reused for as long as
+    :func:`discover_submodules` keeps returning the same (cached) dicts. Keying
+    validity on the identity of those dicts means ``discover_submodules.cache_clear()``
+    — or patching it in tests — transparently invalidates the index as well.
+    """
+    sources: tuple[dict[str, str], ...] = (discover_submodules(ns_module, require_init=True),)
+    if tests_package:
+        logging.debug("Adding modules from tests_package: %s", tests_package)
+        sources += (discover_submodules(tests_package, require_init=False),)
+
+    key = (ns_module, tests_package)
+    cached = _MODULE_INDEXES.get(key)
+    if cached is not None and len(cached[0]) == len(sources) and all(map(operator.is_, cached[0], sources)):
+        return cached[1]
+
+    # Later sources win on duplicate module names, matching {**submodules, **test_submodules}.
+    module_to_path: dict[str, str] = {}
+    for submodules in sources:
+        module_to_path.update(submodules)
+    index = (module_to_path, {path: name for name, path in module_to_path.items()})
+
+    _MODULE_INDEXES[key] = (sources, index)
+    return index
 
 
 def resolve_files_to_modules(filenames: list[str], ns_module: str, tests_package: str | None = None):
     """Resolve file paths to their corresponding Python module names.
 
     Uses filesystem-based discovery (no imports) to build the module mapping.
+    Non-Python files are never modules, so discovery is skipped entirely when no
+    ``.py`` files were given.
     """
-    submodules = discover_submodules(ns_module, require_init=True)
-    if tests_package:
-        logging.debug("Adding modules from tests_package: %s", tests_package)
-        test_submodules = discover_submodules(tests_package, require_init=False)
-        submodules = {**submodules, **test_submodules}
+    py_files = [file for file in filenames if file.endswith(".py")]
+    if not py_files:
+        return []
 
-    # Build reverse mapping: absolute file path -> module name
-    path_to_module = {path: name for name, path in submodules.items()}
+    path_to_module = _module_index(ns_module, tests_package)[1]
 
-    resolved_modules = []
-    for file in filenames:
-        if not file.endswith(".py"):
-            continue
+    # Equivalent to os.path.abspath(), which would call os.getcwd() once per file.
+    cwd = os.getcwd()
+    join, normpath, isabs = os.path.join, os.path.normpath, os.path.isabs
 
-        abs_path = os.path.abspath(file)
+    resolved_modules = []
+    for file in py_files:
+        abs_path = normpath(file if isabs(file) else join(cwd, file))
         if abs_path in path_to_module:
             resolved_modules.append(path_to_module[abs_path])
         else:
@@ -215,9 +393,10 @@ def resolve_modules_to_files(
 
     Uses filesystem-based discovery (no imports) to find module files.
     """
-    submodules = discover_submodules(ns_module, require_init=True)
-    if tests_package:
-        submodules = {**submodules, **discover_submodules(tests_package, require_init=False)}
+    if not modules:
+        return []
+
+    submodules = _module_index(ns_module, tests_package)[0]
 
     result = []
     for module_name in modules:
@@ -1,5 +1,6 @@
 """Tests for dependency tree caching functionality."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 from pytest_impacted.strategies import cached_build_dep_tree, clear_dep_tree_cache
@@ -28,12 +29,27 @@ class TestCaching:
         result2 = cached_build_dep_tree("mypackage", "tests")
 
         # build_dep_tree should only be called once due to caching
-        mock_build_tree.assert_called_once_with("mypackage", tests_package="tests")
+        mock_build_tree.assert_called_once_with("mypackage", tests_package="tests", cache_dir=None)
 
         # Both results should be the same
         assert result1 is result2
         assert result1 is mock_dep_tree
 
+    @patch("pytest_impacted.strategies.build_dep_tree")
+    def test_cache_clear_and_info_on_public_wrapper(self, mock_build_tree):
+        """cached_build_dep_tree keeps lru_cache's cache_clear()/cache_info()."""
+        mock_build_tree.return_value = MagicMock()
+
+        cached_build_dep_tree("mypackage", "tests")
+        cached_build_dep_tree("mypackage", "tests")
+        info = cached_build_dep_tree.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+        cached_build_dep_tree.cache_clear()
+        assert cached_build_dep_tree.cache_info().currsize == 0
+        cached_build_dep_tree("mypackage", "tests")
+        assert mock_build_tree.call_count == 2
+
     @patch("pytest_impacted.strategies.build_dep_tree")
     def test_cache_different_parameters(self, mock_build_tree):
         """Test that different parameters result in different cache entries."""
@@ -47,8 +63,8 @@ class TestCaching:
 
         # build_dep_tree should be called twice with different parameters
         assert mock_build_tree.call_count == 2
-        mock_build_tree.assert_any_call("mypackage", tests_package="tests")
-        mock_build_tree.assert_any_call("mypackage", tests_package="other_tests")
+        mock_build_tree.assert_any_call("mypackage", tests_package="tests", cache_dir=None)
+        mock_build_tree.assert_any_call("mypackage", tests_package="other_tests", cache_dir=None)
 
         # Results should be different
         assert result1 is mock_dep_tree1
@@ -85,7 +101,7 @@ class TestCaching:
         result2 = cached_build_dep_tree("mypackage", None)
 
         # Should only call build_dep_tree once
-        mock_build_tree.assert_called_once_with("mypackage", tests_package=None)
+        mock_build_tree.assert_called_once_with("mypackage", tests_package=None, cache_dir=None)
         assert result1 is result2
 
     def test_clear_dep_tree_cache_also_clears_discover_submodules(self):
@@ -101,3 +117,77 @@ class TestCaching:
         # discover_submodules cache should also be cleared
         cache_info_after = discover_submodules.cache_info()
         assert cache_info_after.currsize == 0
+
+    @patch("pytest_impacted.strategies.build_dep_tree")
+    def test_cache_is_keyed_on_working_directory(self, mock_build_tree, tmp_path, monkeypatch):
+        """The same package name in another working directory gets its own tree."""
+        mock_build_tree.side_effect = lambda *args, **kwargs: MagicMock()
+        for project in ("one", "two"):
+            (tmp_path / project / "mypackage").mkdir(parents=True)
+
+        monkeypatch.chdir(tmp_path / "one")
+        result1 = cached_build_dep_tree("mypackage")
+        monkeypatch.chdir(tmp_path / "two")
+        result2 = cached_build_dep_tree("mypackage")
+
+        assert mock_build_tree.call_count == 2
+        assert result1 is not result2
+
+    @patch("pytest_impacted.strategies.build_dep_tree")
+    def test_cache_invalidated_when_package_root_changes(self, mock_build_tree, tmp_path, monkeypatch):
+        """Adding a module to the package root rebuilds the tree."""
+        mock_build_tree.side_effect = lambda *args, **kwargs: MagicMock()
+        root = tmp_path / "mypackage"
+        root.mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        result1 = cached_build_dep_tree("mypackage")
+        assert cached_build_dep_tree("mypackage") is result1
+
+        (root / "new_module.py").touch()
+        stat = os.stat(root)
+        os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cached_build_dep_tree("mypackage") is not result1
+        assert mock_build_tree.call_count == 2
+
+    @patch("pytest_impacted.strategies.build_dep_tree")
+    def test_cache_invalidated_when_sub_package_changes(self, mock_build_tree, tmp_path, monkeypatch):
+        """Adding a module to a nested sub-package rebuilds the tree even though the root is unchanged."""
+        mock_build_tree.side_effect = lambda *args, **kwargs: MagicMock()
+        sub = tmp_path / "mypackage" / "sub"
+        sub.mkdir(parents=True)
+        (tmp_path / "mypackage" / "__init__.py").touch()
+        (sub / "__init__.py").touch()
+        monkeypatch.chdir(tmp_path)
+
+        result1 = cached_build_dep_tree("mypackage")
+        assert cached_build_dep_tree("mypackage") is result1
+
+        (sub / "new_module.py").touch()
+        stat = os.stat(sub)
+        os.utime(sub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cached_build_dep_tree("mypackage") is not result1
+        assert mock_build_tree.call_count == 2
+
+    @patch("pytest_impacted.strategies.build_dep_tree")
+    def test_cache_invalidated_when_module_contents_change(self, mock_build_tree, tmp_path, monkeypatch):
+        """Editing an existing module rebuilds the tree even though no directory mtime changes."""
+        mock_build_tree.side_effect = lambda *args, **kwargs: MagicMock()
+        root = tmp_path / "mypackage"
+        root.mkdir()
+        (root / "__init__.py").touch()
+        module = root / "core.py"
+        module.write_text("import os\n")
+        monkeypatch.chdir(tmp_path)
+
+        result1 = cached_build_dep_tree("mypackage")
+        assert cached_build_dep_tree("mypackage") is result1
+
+        root_mtime = os.stat(root).st_mtime_ns
+        module.write_text("import os\nimport sys\n")
+        assert os.stat(root).st_mtime_ns == root_mtime
+
+        assert cached_build_dep_tree("mypackage") is not result1
+        assert mock_build_tree.call_count == 2
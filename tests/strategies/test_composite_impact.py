@@ -1,7 +1,6 @@
 """unit-tests for the composite impact strategy module."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import networkx as nx
 
@@ -15,16 +14,25 @@ from pytest_impacted.strategies import (
 )
 
 
+class _Stub(ImpactStrategy):
+    """Test double returning fixed results and recording the kwargs of each call."""
+
+    def __init__(self, out):
+        self.out = out
+        self.calls = []
+
+    def find_impacted_tests(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.out
+
+
 class TestCompositeImpactStrategy:
     """Test the composite strategy that combines multiple strategies."""
 
     def test_find_impacted_tests_combines_strategies(self):
         """Test that composite strategy combines results from multiple strategies."""
-        strategy1 = MagicMock(spec=ImpactStrategy)
-        strategy1.find_impacted_tests.return_value = ["test_a", "test_b"]
-
-        strategy2 = MagicMock(spec=ImpactStrategy)
-        strategy2.find_impacted_tests.return_value = ["test_b", "test_c"]
+        strategy1 = _Stub(["test_a", "test_b"])
+        strategy2 = _Stub(["test_b", "test_c"])
 
         dep_tree = nx.DiGraph()
         composite = CompositeImpactStrategy([strategy1, strategy2])
@@ -39,10 +47,8 @@ class TestCompositeImpactStrategy:
         assert sorted(result) == ["test_a", "test_b", "test_c"]
 
         # Both strategies should receive the same dep_tree instance
-        dep_tree_1 = strategy1.find_impacted_tests.call_args[1]["dep_tree"]
-        dep_tree_2 = strategy2.find_impacted_tests.call_args[1]["dep_tree"]
-        assert dep_tree_1 is dep_tree
-        assert dep_tree_2 is dep_tree
+        assert strategy1.calls[0]["dep_tree"] is dep_tree
+        assert strategy2.calls[0]["dep_tree"] is dep_tree
 
     def test_find_impacted_tests_empty_strategies(self):
         """Test composite strategy with no sub-strategies."""
@@ -57,8 +63,7 @@ class TestCompositeImpactStrategy:
 
     def test_find_impacted_tests_single_strategy(self):
         """Test composite strategy with single sub-strategy."""
-        strategy = MagicMock(spec=ImpactStrategy)
-        strategy.find_impacted_tests.return_value = ["test_a"]
+        strategy = _Stub(["test_a"])
 
         composite = CompositeImpactStrategy([strategy])
         result = composite.find_impacted_tests(
@@ -69,7 +74,7 @@ class TestCompositeImpactStrategy:
         )
 
         assert result == ["test_a"]
-        strategy.find_impacted_tests.assert_called_once()
+        assert len(strategy.calls) == 1
 
 
 class TestGetDefaultStrategies:
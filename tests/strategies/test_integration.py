@@ -1,9 +1,9 @@
 """Integration tests for the strategies sub-modules."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from pytest_impacted.strategies import (
     PytestImpactStrategy,
 )
@@ -12,10 +12,10 @@ from pytest_impacted.strategies import (
 class TestIntegration:
     """Integration tests for the strategy system."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.root_dir = Path(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _root_dir(self, tmp_path):
+        """Give each test its own pytest-managed root directory (cleaned up by pytest)."""
+        self.root_dir = tmp_path
 
     def test_pytest_strategy_includes_ast_results(self):
         """Test that PytestImpactStrategy includes AST results."""
@@ -1,9 +1,9 @@
 """Unit-tests for the strategies module."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from pytest_impacted.strategies import (
     PytestImpactStrategy,
 )
@@ -12,10 +12,10 @@ from pytest_impacted.strategies import (
 class TestPytestImpactStrategy:
     """Test the pytest-specific impact strategy."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.root_dir = Path(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _root_dir(self, tmp_path):
+        """Give each test its own pytest-managed root directory (cleaned up by pytest)."""
+        self.root_dir = tmp_path
 
     @patch("pytest_impacted.strategies.resolve_impacted_tests")
     @patch("pytest_impacted.strategies.is_test_module")
@@ -74,6 +74,33 @@ class TestPytestImpactStrategy:
         assert "tests.subdir.test_example" in result
         assert "tests.test_other" not in result  # This one is not in a subdirectory
 
+    @patch("pytest_impacted.strategies.resolve_impacted_tests", return_value=[])
+    def test_multiple_conftests_locate_each_module_once(self, mock_resolve):
+        """Each test module's file is located once, however many conftest files changed."""
+        for subdir in ("a", "b"):
+            (self.root_dir / "tests" / subdir).mkdir(parents=True)
+            (self.root_dir / "tests" / subdir / "conftest.py").touch()
+            (self.root_dir / "tests" / subdir / "test_x.py").touch()
+
+        mock_dep_tree = MagicMock()
+        mock_dep_tree.nodes = ["tests.a.test_x", "tests.b.test_x", "pkg.core"]
+        strategy = PytestImpactStrategy()
+
+        with patch.object(
+            PytestImpactStrategy, "_resolved_module_paths", wraps=PytestImpactStrategy._resolved_module_paths
+        ) as mock_paths:
+            result = strategy.find_impacted_tests(
+                changed_files=["tests/a/conftest.py", "tests/b/conftest.py"],
+                impacted_modules=[],
+                ns_module="pkg",
+                tests_package="tests",
+                root_dir=self.root_dir,
+                dep_tree=mock_dep_tree,
+            )
+
+        assert result == ["tests.a.test_x", "tests.b.test_x"]
+        assert sorted(call.args[0] for call in mock_paths.call_args_list) == ["tests.a.test_x", "tests.b.test_x"]
+
     def test_is_test_affected_by_conftest(self):
         """Test the conftest impact detection logic."""
         # Create test directory structure
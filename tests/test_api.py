@@ -51,6 +51,12 @@ from pytest_impacted.strategies import ImpactStrategy
             False,
             id="false_suffix_no_boundary",
         ),
+        pytest.param(
+            "tests/test_example.py",
+            ["project/mytests/test_example.py"],
+            False,
+            id="false_directory_suffix_no_boundary",
+        ),
     ],
 )
 def test_matches_impacted_tests(item_path, impacted_tests, expected):
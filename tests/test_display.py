@@ -49,3 +49,21 @@ def test_warn_without_session():
     with patch.object(logging, "warning") as mock_warning:
         display.warn("Danger!", None)
         mock_warning.assert_called_once_with("\nWARNING: %s\n", "Danger!")
+
+
+def test_notify_without_terminal_reporter():
+    """Messages fall back to logging when the terminal reporter is disabled (-p no:terminal)."""
+    session, _ = make_mock_session()
+    session.config.pluginmanager.getplugin.return_value = None
+    with patch.object(logging, "info") as mock_info:
+        display.notify("Hello, world!", session)
+        mock_info.assert_called_once_with("\n%s\n", "Hello, world!")
+
+
+def test_warn_without_terminal_reporter():
+    """Warnings fall back to logging when the terminal reporter is disabled (-p no:terminal)."""
+    session, _ = make_mock_session()
+    session.config.pluginmanager.getplugin.return_value = None
+    with patch.object(logging, "warning") as mock_warning:
+        display.warn("Danger!", session)
+        mock_warning.assert_called_once_with("\nWARNING: %s\n", "Danger!")
@@ -1,5 +1,8 @@
 """Unit tests for the git module."""
 
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,34 +12,29 @@ from pytest_impacted import git
 from pytest_impacted.git import find_repo, normalize_git_paths
 
 
+def porcelain(*entries):
+    """Build `git status --porcelain=v1 -z` output from its entries."""
+    return "".join(f"{entry}\0" for entry in entries)
+
+
 class DummyRepo:
     def __init__(
         self,
-        dirty=False,
-        diff_result=None,
+        status_result=None,
         diff_branch_result=None,
-        untracked_files=None,
         current_branch="feature/some-feature-branch",
         working_tree_dir=None,
     ):
-        self._dirty = dirty
-        self._diff_result = diff_result or []
+        self._status_result = status_result or ""
         self._diff_branch_result = diff_branch_result or ""
-        self.untracked_files = untracked_files or []
-        self.index = MagicMock()
-        self.index.diff = MagicMock(return_value=self._diff_result)
         self.git = MagicMock()
+        self.git.status = MagicMock(return_value=self._status_result)
         self.git.diff = MagicMock(return_value=self._diff_branch_result)
         self.commit = MagicMock()
         self.head = MagicMock()
         self.head.reference = current_branch
         self.working_tree_dir = working_tree_dir or str(Path.cwd())
 
-    def is_dirty(self, **kwargs):
-        if kwargs.get("untracked_files"):
-            return self._dirty or bool(self.untracked_files)
-        return self._dirty
-
 
 @patch("pytest_impacted.git.GIT_AVAILABLE", False)
 def test_find_impacted_files_in_repo_git_not_available():
@@ -46,44 +44,40 @@ def test_find_impacted_files_in_repo_git_not_available():
     assert result is None
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_unstaged_clean(mock_repo):
-    mock_repo.return_value = DummyRepo(dirty=False)
+    mock_repo.return_value = DummyRepo()
     result = git.find_impacted_files_in_repo(".", git.GitMode.UNSTAGED, None)
     assert result is None
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_unstaged_dirty(mock_repo):
-    # Create mock diff objects with change_type attribute
-    diff1 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff2 = MagicMock(a_path=None, b_path="file2.py", change_type="A")
-    diff_result = [diff1, diff2]
-    mock_repo.return_value = DummyRepo(dirty=True, diff_result=diff_result)
+    # Modified in the working tree, and an intent-to-add file
+    mock_repo.return_value = DummyRepo(status_result=porcelain(" M file1.py", " A file2.py"))
     result = git.find_impacted_files_in_repo(".", git.GitMode.UNSTAGED, None)
     assert set(result) == {"file1.py", "file2.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_unstaged_dirty_with_untracked_files(mock_repo):
-    # Create mock diff objects with change_type attribute
-    diff1 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff2 = MagicMock(a_path=None, b_path="file2.py", change_type="A")
-    diff_result = [diff1, diff2]
-    mock_repo.return_value = DummyRepo(dirty=True, diff_result=diff_result, untracked_files=["file3.py", "file4.py"])
+    mock_repo.return_value = DummyRepo(
+        status_result=porcelain(" M file1.py", " A file2.py", "?? file3.py", "?? file4.py")
+    )
     result = git.find_impacted_files_in_repo(".", git.GitMode.UNSTAGED, None)
     assert set(result) == {"file1.py", "file2.py", "file3.py", "file4.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_unstaged_dirty_no_changes(mock_repo):
     """Test UNSTAGED mode when repo is dirty but no actual file changes or untracked files."""
-    mock_repo.return_value = DummyRepo(dirty=True, diff_result=[], untracked_files=[])
+    # Staged-only changes do not show up in the working tree column.
+    mock_repo.return_value = DummyRepo(status_result=porcelain("M  staged.py", "A  staged_new.py"))
     result = git.find_impacted_files_in_repo(".", git.GitMode.UNSTAGED, None)
     assert result is None
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_branch(mock_repo):
     diff_branch_result = "M\tfile3.py\nA\tfile4.py\n"
     mock_repo.return_value = DummyRepo(diff_branch_result=diff_branch_result)
@@ -91,7 +85,7 @@ def test_find_impacted_files_in_repo_branch(mock_repo):
     assert set(result) == {"file3.py", "file4.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_branch_none(mock_repo):
     diff_branch_result = ""
     mock_repo.return_value = DummyRepo(diff_branch_result=diff_branch_result)
@@ -310,37 +304,33 @@ def test_changeset_from_git_diff_name_status_output_empty():
     assert len(change_set.changes) == 0
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_unstaged_mode_clean_repo(mock_repo):
     """Test impacted_files_for_unstaged_mode with clean repo."""
-    repo = DummyRepo(dirty=False)
+    repo = DummyRepo()
     result = git.impacted_files_for_unstaged_mode(repo)
     assert result is None
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_unstaged_mode_only_untracked_files(mock_repo):
     """Untracked files should be detected even when no tracked files are modified."""
-    repo = DummyRepo(dirty=False, untracked_files=["tests/test_new.py"])
+    repo = DummyRepo(status_result=porcelain("?? tests/test_new.py"))
     result = git.impacted_files_for_unstaged_mode(repo)
     assert result == ["tests/test_new.py"]
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_unstaged_mode_with_deleted_files(mock_repo):
     """Test impacted_files_for_unstaged_mode with deleted files."""
-    diff1 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff2 = MagicMock(a_path="deleted.py", b_path=None, change_type="D")
-    diff_result = [diff1, diff2]
-
-    repo = DummyRepo(dirty=True, diff_result=diff_result)
+    repo = DummyRepo(status_result=porcelain(" M file1.py", " D deleted.py"))
     result = git.impacted_files_for_unstaged_mode(repo)
 
     # Should only include modified and added files, not deleted
     assert result == ["file1.py"]
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_branch_mode_with_deleted_files(mock_repo):
     """Test impacted_files_for_branch_mode with deleted files."""
     diff_output = """M\tmodified.py
@@ -427,12 +417,10 @@ def test_changeset_from_git_diff_name_status_output_malformed():
     assert change_set.changes[0].name == "file1.py\textra_data"
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_in_repo_with_path_object(mock_repo):
     """Test find_impacted_files_in_repo with Path object instead of string."""
-    diff1 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff_result = [diff1]
-    mock_repo.return_value = DummyRepo(dirty=True, diff_result=diff_result)
+    mock_repo.return_value = DummyRepo(status_result=porcelain(" M file1.py"))
 
     result = git.find_impacted_files_in_repo(Path("."), git.GitMode.UNSTAGED, None)
     assert result == ["file1.py"]
@@ -511,22 +499,18 @@ def test_changeset_from_diff_objs_with_none_a_path():
     assert change_set.changes[1].name == "existing_file.py"  # Uses a_path when available
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_unstaged_mode_with_none_names(mock_repo):
-    """Test impacted_files_for_unstaged_mode with files that have None names."""
-    # Create diff objects where some have None names
-    diff1 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff2 = MagicMock(a_path=None, b_path=None, change_type="D")  # This will have None name
-    diff_result = [diff1, diff2]
-
-    repo = DummyRepo(dirty=True, diff_result=diff_result, untracked_files=["untracked.py"])
+    """Test impacted_files_for_unstaged_mode with entries that have no usable name."""
+    # A truncated entry without a path
+    repo = DummyRepo(status_result=porcelain(" M file1.py", " D", "?? untracked.py"))
     result = git.impacted_files_for_unstaged_mode(repo)
 
     # Should filter out None names and only include valid files
     assert set(result) == {"file1.py", "untracked.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_branch_mode_with_none_names(mock_repo):
     """Test impacted_files_for_branch_mode with files that have None names."""
     # Create diff output that results in None names
@@ -557,20 +541,17 @@ def test_git_status_from_git_diff_name_status_copy_and_rename():
     assert git.GitStatus.from_git_diff_name_status("R75") == git.GitStatus.RENAMED
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_unstaged_mode_with_renamed_files(mock_repo):
     """Test impacted_files_for_unstaged_mode includes both paths for renamed files."""
-    diff1 = MagicMock(a_path="old_name.py", b_path="new_name.py", change_type="R")
-    diff2 = MagicMock(a_path="file1.py", b_path=None, change_type="M")
-    diff_result = [diff1, diff2]
-
-    repo = DummyRepo(dirty=True, diff_result=diff_result)
+    # Renamed in the working tree (intent-to-add), and modified
+    repo = DummyRepo(status_result=porcelain(" R new_name.py", "old_name.py", " M file1.py"))
     result = git.impacted_files_for_unstaged_mode(repo)
 
     assert set(result) == {"old_name.py", "new_name.py", "file1.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_branch_mode_with_renamed_files(mock_repo):
     """Test impacted_files_for_branch_mode includes both paths for renamed files."""
     diff_output = "R100\told_name.py\tnew_name.py\nM\tmodified.py\n"
@@ -580,7 +561,7 @@ def test_impacted_files_for_branch_mode_with_renamed_files(mock_repo):
     assert set(result) == {"old_name.py", "new_name.py", "modified.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_branch_mode_with_copied_files(mock_repo):
     """Test impacted_files_for_branch_mode includes both paths for copied files."""
     diff_output = "C85\toriginal.py\tcopy.py\nA\tnew_file.py\n"
@@ -590,7 +571,7 @@ def test_impacted_files_for_branch_mode_with_copied_files(mock_repo):
     assert set(result) == {"original.py", "copy.py", "new_file.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_impacted_files_for_branch_mode_detached_head(mock_repo):
     """Test impacted_files_for_branch_mode handles detached HEAD (common in CI)."""
     diff_output = "M\tfile1.py\n"
@@ -613,7 +594,7 @@ def test_impacted_files_for_branch_mode_detached_head(mock_repo):
 # --- Tests for find_repo and normalize_git_paths (monorepo support) ---
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_repo_uses_search_parent_directories(mock_repo):
     """find_repo passes search_parent_directories=True to GitPython."""
     find_repo("/some/path")
@@ -648,13 +629,20 @@ def test_normalize_git_paths_deeply_nested():
     assert result == ["src/mod.py"]
 
 
+def test_normalize_git_paths_sibling_with_common_prefix():
+    """A sibling directory sharing a name prefix with working_dir is not treated as inside it."""
+    paths = ["backend-legacy/mod.py", "backend/mod.py"]
+    result = normalize_git_paths(paths, Path("/repo"), Path("/repo/backend"))
+    assert result == ["/repo/backend-legacy/mod.py", "mod.py"]
+
+
 def test_normalize_git_paths_empty_list():
     """Empty input returns empty output."""
     result = normalize_git_paths([], Path("/repo"), Path("/repo/sub"))
     assert result == []
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_monorepo_branch_mode(mock_repo):
     """In a monorepo, git-relative paths are converted to CWD-relative."""
     diff_output = "M\tbackend/src/pkg/module.py\nA\tbackend/tests/test_foo.py\n"
@@ -668,14 +656,11 @@ def test_find_impacted_files_monorepo_branch_mode(mock_repo):
     assert set(result) == {"src/pkg/module.py", "tests/test_foo.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_monorepo_unstaged_mode(mock_repo):
     """In a monorepo, unstaged files are also normalized to CWD-relative paths."""
-    diff1 = MagicMock(a_path="backend/src/module.py", b_path=None, change_type="M")
     mock_repo.return_value = DummyRepo(
-        dirty=True,
-        diff_result=[diff1],
-        untracked_files=["backend/src/new_file.py"],
+        status_result=porcelain(" M backend/src/module.py", "?? backend/src/new_file.py"),
         working_tree_dir="/monorepo",
     )
 
@@ -684,7 +669,7 @@ def test_find_impacted_files_monorepo_unstaged_mode(mock_repo):
     assert set(result) == {"src/module.py", "src/new_file.py"}
 
 
-@patch("pytest_impacted.git.Repo")
+@patch("git.Repo")
 def test_find_impacted_files_monorepo_files_outside_cwd(mock_repo):
     """Files in sibling directories are returned as absolute paths."""
     diff_output = "M\tbackend/src/module.py\nM\tfrontend/app.js\n"
@@ -697,3 +682,89 @@ def test_find_impacted_files_monorepo_files_outside_cwd(mock_repo):
 
     assert "src/module.py" in result
     assert "/monorepo/frontend/app.js" in result
+
+
+def test_gitpython_is_imported_lazily():
+    """Importing the plugin does not import GitPython until git is actually used."""
+    code = "import sys, pytest_impacted.plugin; print('git' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_impacted_files_for_branch_mode_rename_reports_both_paths():
+    """A renamed file impacts both its old and its new path."""
+    repo = DummyRepo(diff_branch_result="R100\told_name.py\tnew_name.py\n")
+
+    assert git.impacted_files_for_branch_mode(repo, "main") == ["old_name.py", "new_name.py"]
+    assert repo.git.diff.call_args.kwargs == {"name_status": True}
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git CLI not available")
+def test_impacted_files_for_branch_mode_moved_conftest(tmp_path):
+    """Moving a conftest.py away on a branch still reports its old location.
+
+    Conftest-based impact analysis matches on changed file paths, so the tests
+    under the directory the conftest left must still be considered impacted.
+    """
+
+    def run_git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    (tmp_path / "tests" / "unit").mkdir(parents=True)
+    (tmp_path / "tests" / "unit" / "conftest.py").write_text("import pytest\n")
+    (tmp_path / "tests" / "unit" / "test_a.py").write_text("def test_a():\n    pass\n")
+    run_git("init", "-q", "-b", "main")
+    run_git("add", ".")
+    run_git("commit", "-q", "-m", "initial")
+    run_git("checkout", "-q", "-b", "feature")
+    (tmp_path / "tests" / "shared").mkdir()
+    run_git("mv", "tests/unit/conftest.py", "tests/shared/conftest.py")
+    run_git("commit", "-q", "-m", "move conftest")
+
+    impacted = git.impacted_files_for_branch_mode(find_repo(tmp_path), "main")
+
+    assert impacted is not None
+    assert set(impacted) == {"tests/unit/conftest.py", "tests/shared/conftest.py"}
+
+
+def test_impacted_files_for_unstaged_mode_does_not_precheck_dirty():
+    """The working tree is read with a single status call, without a separate is_dirty() scan."""
+    repo = DummyRepo(status_result=porcelain(" M file1.py"))
+    repo.is_dirty = MagicMock(side_effect=AssertionError("is_dirty() should not be called"))
+
+    assert git.impacted_files_for_unstaged_mode(repo) == ["file1.py"]
+    repo.git.status.assert_called_once_with(porcelain="v1", z=True, untracked_files="all")
+
+
+def test_changeset_from_git_status_porcelain_output():
+    """Only working tree changes and untracked files are reported; rename sources consumed, unmerged skipped."""
+    output = porcelain(
+        "MM both.py",
+        "M  staged_only.py",
+        "RM renamed_new.py",
+        "renamed_old.py",
+        " D removed.py",
+        " T typechange.py",
+        "UU conflicted.py",
+        "AA both_added.py",
+        "DD both_deleted.py",
+        "AU added_by_us.py",
+        "UD deleted_by_them.py",
+        "?? untracked dir/file name.py",
+    )
+
+    change_set = git.ChangeSet.from_git_status_porcelain_output(output)
+
+    assert [(c.name, c.status) for c in change_set.changes] == [
+        ("both.py", git.GitStatus.MODIFIED),
+        ("renamed_new.py", git.GitStatus.MODIFIED),
+        ("removed.py", git.GitStatus.DELETED),
+        ("typechange.py", git.GitStatus.TYPE_CHANGE),
+        ("untracked dir/file name.py", git.GitStatus.ADDED),
+    ]
@@ -67,6 +67,87 @@ def test_resolve_impacted_tests_dangling_production_module(sample_dep_tree):
     assert "test_module2" in impacted
 
 
+def test_resolve_impacted_tests_dangling_production_module_skips_traversal(sample_dep_tree):
+    """Once a dangling production module marks every test, no traversal is performed."""
+    with patch("pytest_impacted.graph._reachable_tests") as mock_reachable:
+        impacted = graph.resolve_impacted_tests(
+            ["module_a", "unknown_prod_module", "test_new_feature"], sample_dep_tree
+        )
+
+    mock_reachable.assert_not_called()
+    # Dangling test modules listed after the production miss are still included.
+    assert impacted == ["test_module1", "test_module2", "test_new_feature"]
+
+
+def test_reachable_tests_stops_once_all_tests_found():
+    """The BFS stops expanding as soon as every test node has been reached."""
+    expanded = []
+
+    class _RecordingSucc:
+        def __init__(self, succ):
+            self._succ = succ
+
+        def __getitem__(self, node):
+            expanded.append(node)
+            return self._succ[node]
+
+    class _RecordingDiGraph(nx.DiGraph):
+        @property
+        def succ(self):
+            return _RecordingSucc(super().succ)
+
+    digraph = _RecordingDiGraph()
+    digraph.add_edges_from([("core", "test_core"), ("core", "mid"), ("mid", "leaf"), ("leaf", "deeper")])
+    found = graph._reachable_tests(digraph, ["core"], frozenset({"test_core"}))
+
+    assert found == {"test_core"}
+    assert expanded == ["core"]
+
+
+def test_resolve_impacted_tests_on_graph_views():
+    """Subgraph and reversed views are traversed like the graphs they wrap."""
+    digraph = nx.DiGraph()
+    digraph.add_edges_from([("core", "mid"), ("mid", "test_mid"), ("other", "test_other")])
+
+    subgraph = digraph.subgraph(["core", "mid", "test_mid"])
+    assert graph.resolve_impacted_tests(["core"], subgraph) == ["test_mid"]
+
+    # Reversed twice is the original orientation again, but served through views.
+    reversed_twice = nx.reverse_view(nx.reverse_view(digraph))
+    assert graph.resolve_impacted_tests(["core"], reversed_twice) == ["test_mid"]
+
+
+def test_resolve_impacted_tests_overlapping_sources():
+    """Overlapping dependency cones are traversed once and yield each test a single time."""
+    digraph = nx.DiGraph()
+    digraph.add_edges_from(
+        [
+            ("core", "mid_a"),
+            ("core", "mid_b"),
+            ("mid_a", "leaf"),
+            ("mid_b", "leaf"),
+            ("leaf", "test_leaf"),
+            ("mid_b", "test_mid_b"),
+        ]
+    )
+
+    impacted = graph.resolve_impacted_tests(["core", "mid_a", "leaf"], digraph)
+
+    assert impacted == ["test_leaf", "test_mid_b"]
+
+
+def test_resolve_impacted_tests_duplicate_modules(sample_dep_tree, caplog):
+    """Duplicate impacted modules are seeded once and dangling ones are warned about once."""
+    with patch("pytest_impacted.graph._reachable_tests", wraps=graph._reachable_tests) as mock_reachable:
+        impacted = graph.resolve_impacted_tests(
+            ["module_a", "module_a", "test_new", "test_new", "module_a"], sample_dep_tree
+        )
+
+    assert impacted == ["test_module1", "test_new"]
+    assert mock_reachable.call_args.args[1] == ["module_a"]
+    assert sum("test_new is marked as impacted" in record.getMessage() for record in caplog.records) == 1
+
+
 def test_build_dep_tree():
     """Test building dependency tree from a package."""
     # Mock discovered submodules: name -> absolute file path
@@ -96,6 +177,58 @@ def test_build_dep_tree():
         assert dep_tree.has_edge("module_c", "module_b")
 
 
+def test_build_dep_tree_caches_test_nodes():
+    """build_dep_tree precomputes the test-module set, and enrichment invalidates it."""
+    mock_submodules = {
+        "pkg.core": "/fake/pkg/core.py",
+        "tests.test_core": "/fake/tests/test_core.py",
+    }
+
+    with (
+        patch("pytest_impacted.graph.RUST_AVAILABLE", False),
+        patch("pytest_impacted.graph.discover_submodules", return_value=mock_submodules),
+        patch("pytest_impacted.graph.parse_file_imports", side_effect=[[], ["pkg.core"]]),
+    ):
+        dep_tree = graph.build_dep_tree("pkg")
+
+    assert dep_tree.graph[graph._TEST_NODES_KEY] == (
+        frozenset({"pkg.core", "tests.test_core"}),
+        frozenset({"tests.test_core"}),
+    )
+
+    # Simulate an extension adding a synthetic test node after the graph was built.
+    enriched = dep_tree.copy()
+    enriched.add_edge("pkg.core", "tests.test_synthetic")
+    assert graph.resolve_impacted_tests(["pkg.core"], enriched) == ["tests.test_core", "tests.test_synthetic"]
+
+
+def test_test_nodes_cache_invalidated_when_node_count_is_unchanged():
+    """Swapping nodes without changing the count must not reuse the cached test set."""
+    mock_submodules = {
+        "pkg.core": "/fake/pkg/core.py",
+        "pkg.util": "/fake/pkg/util.py",
+        "tests.test_core": "/fake/tests/test_core.py",
+    }
+
+    with (
+        patch("pytest_impacted.graph.RUST_AVAILABLE", False),
+        patch("pytest_impacted.graph.discover_submodules", return_value=mock_submodules),
+        patch("pytest_impacted.graph.parse_file_imports", side_effect=[[], [], ["pkg.core"]]),
+    ):
+        dep_tree = graph.build_dep_tree("pkg")
+
+    # An enrichment that removes one node and adds a test keeps the node count.
+    enriched = dep_tree.copy()
+    enriched.remove_node("pkg.util")
+    enriched.add_edge("pkg.core", "tests.test_synth")
+    assert graph.resolve_impacted_tests(["pkg.core"], enriched) == ["tests.test_core", "tests.test_synth"]
+
+    # An in-place relabel keeps the count too.
+    relabeled = nx.relabel_nodes(dep_tree.copy(), {"pkg.util": "tests.test_util"}, copy=False)
+    relabeled.add_edge("pkg.core", "tests.test_util")
+    assert graph.resolve_impacted_tests(["pkg.core"], relabeled) == ["tests.test_core", "tests.test_util"]
+
+
 def test_pruned_singleton_init_triggers_run_all():
     """A changed __init__.py singleton should not cause all tests to run."""
     mock_submodules = {
@@ -171,3 +304,73 @@ def test_inverted():
     assert inverted_graph.has_edge("module_c", "module_b")
     assert not inverted_graph.has_edge("module_a", "module_b")
     assert not inverted_graph.has_edge("module_b", "module_c")
+
+
+def _write_modules(tmp_path, count):
+    """Write *count* modules that each import the previous one; return name -> path."""
+    submodules = {}
+    for i in range(count):
+        path = tmp_path / f"mod_{i}.py"
+        path.write_text(f"import pkg.mod_{i - 1}\n" if i else "")
+        submodules[f"pkg.mod_{i}"] = str(path)
+    return submodules
+
+
+@pytest.mark.parametrize(
+    "num_tasks,env_value,expected",
+    [
+        (graph._PARALLEL_PARSE_THRESHOLD - 1, "8", 1),
+        (100, "1", 1),
+        (100, "0", 1),
+        (100, "4", 4),
+        (graph._PARALLEL_PARSE_THRESHOLD + 5, "1000", graph._PARALLEL_PARSE_THRESHOLD + 5),
+    ],
+)
+def test_parse_worker_count(monkeypatch, num_tasks, env_value, expected):
+    """Small packages and PYTEST_IMPACTED_WORKERS<=1 parse sequentially; otherwise use the pool."""
+    monkeypatch.setenv(graph.WORKERS_ENV_VAR, env_value)
+
+    assert graph._parse_worker_count(num_tasks) == expected
+
+
+def test_parse_worker_count_defaults_to_cpu_count(monkeypatch):
+    """Without an override, one worker per CPU is used."""
+    monkeypatch.delenv(graph.WORKERS_ENV_VAR, raising=False)
+    monkeypatch.setattr(graph.os, "cpu_count", lambda: 6)
+
+    assert graph._parse_worker_count(100) == 6
+
+
+def test_parse_worker_count_invalid_env(monkeypatch):
+    """A non-integer worker count is ignored with a warning."""
+    monkeypatch.setenv(graph.WORKERS_ENV_VAR, "many")
+    monkeypatch.setattr(graph.os, "cpu_count", lambda: 3)
+
+    assert graph._parse_worker_count(100) == 3
+
+
+def test_parse_all_module_imports_parallel_matches_sequential(tmp_path, monkeypatch):
+    """The process-pool fallback yields exactly the same imports as sequential parsing."""
+    submodules = _write_modules(tmp_path, graph._PARALLEL_PARSE_THRESHOLD + 5)
+    monkeypatch.setattr(graph, "RUST_AVAILABLE", False)
+
+    monkeypatch.setenv(graph.WORKERS_ENV_VAR, "1")
+    sequential = graph._parse_all_module_imports(submodules)
+    monkeypatch.setenv(graph.WORKERS_ENV_VAR, "2")
+    parallel = graph._parse_all_module_imports(submodules)
+
+    assert parallel == sequential
+    assert parallel["pkg.mod_3"] == ["pkg.mod_2"]
+
+
+def test_parse_all_module_imports_falls_back_when_pool_fails(tmp_path, monkeypatch):
+    """If a process pool cannot be started, parsing continues sequentially."""
+    submodules = _write_modules(tmp_path, graph._PARALLEL_PARSE_THRESHOLD)
+    monkeypatch.setattr(graph, "RUST_AVAILABLE", False)
+    monkeypatch.setenv(graph.WORKERS_ENV_VAR, "2")
+
+    with patch("pytest_impacted.graph.ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+        result = graph._parse_all_module_imports(submodules)
+
+    assert len(result) == len(submodules)
+    assert result["pkg.mod_1"] == ["pkg.mod_0"]
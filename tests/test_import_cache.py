@@ -0,0 +1,210 @@
+"""Unit tests for the persistent import cache."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from pytest_impacted import _import_cache, graph
+
+
+@pytest.fixture
+def submodules(tmp_path):
+    """Create a tiny package on disk and return its name -> path mapping."""
+    core = tmp_path / "core.py"
+    core.write_text("import os\n")
+    test_core = tmp_path / "test_core.py"
+    test_core.write_text("from pkg import core\n")
+    return {"pkg.core": str(core), "tests.test_core": str(test_core)}
+
+
+def _fake_parse(calls):
+    def parse(modules):
+        calls.append(sorted(modules))
+        return {name: ["pkg.core"] if name.startswith("tests.") else [] for name in modules}
+
+    return parse
+
+
+def test_cache_round_trip(tmp_path):
+    """Entries written by save_cache are returned by load_cache under the same header."""
+    path = tmp_path / "cache" / "imports.json"
+    header = _import_cache.cache_header(["a", "b"], backend="python")
+    entries = {"/src/a.py": (1, 2, "a", ["b"])}
+
+    _import_cache.save_cache(path, header, entries)
+
+    assert _import_cache.load_cache(path, header) == entries
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_cache_header_mismatch_discards_entries(tmp_path):
+    """A cache written for another module set or backend is ignored."""
+    path = tmp_path / "imports.json"
+    _import_cache.save_cache(path, _import_cache.cache_header(["a"], backend="python"), {"/a.py": (1, 2, "a", [])})
+
+    assert _import_cache.load_cache(path, _import_cache.cache_header(["a", "b"], backend="python")) == {}
+    assert _import_cache.load_cache(path, _import_cache.cache_header(["a"], backend="rust")) == {}
+
+
+def test_rust_cache_header_ignores_module_set():
+    """Rust-backend results do not depend on the module set, so neither does its header."""
+    assert _import_cache.cache_header(["a"], backend="rust") == _import_cache.cache_header(["a", "b"], backend="rust")
+
+
+@pytest.mark.parametrize("content", ["", "not json", "[1, 2, 3]"])
+def test_load_cache_tolerates_corrupt_files(tmp_path, content):
+    """Corrupt cache files are treated as empty rather than raising."""
+    path = tmp_path / "imports.json"
+    path.write_text(content)
+
+    assert _import_cache.load_cache(path, _import_cache.cache_header([], backend="python")) == {}
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        [1, 2, "a", 5],
+        ["1", 2, "a", []],
+        [1, None, "a", []],
+        [1, 2, 3, []],
+        [1, 2, "a", ["b", 7]],
+        [1, 2, "a"],
+        "not an entry",
+    ],
+)
+def test_load_cache_drops_malformed_entries(tmp_path, entry):
+    """Entries that are not (int, int, str, list[str]) are dropped; valid ones are kept."""
+    path = tmp_path / "imports.json"
+    header = _import_cache.cache_header(["a"], backend="python")
+    entries = {"/bad.py": entry, "/good.py": [1, 2, "a", ["b"]]}
+    path.write_text(json.dumps({"header": header, "entries": entries}))
+
+    assert _import_cache.load_cache(path, header) == {"/good.py": (1, 2, "a", ["b"])}
+
+
+def test_load_cache_drops_racily_clean_entries(tmp_path):
+    """Entries whose mtime is not older than the cache file are treated as misses."""
+    path = tmp_path / "imports.json"
+    header = _import_cache.cache_header(["a", "b"], backend="python")
+    _import_cache.save_cache(path, header, {"/old.py": (1, 2, "a", []), "/racy.py": (10**18, 2, "b", [])})
+    written_ns = os.stat(path).st_mtime_ns
+    os.utime(path, ns=(written_ns, 10**18))
+
+    assert _import_cache.load_cache(path, header) == {"/old.py": (1, 2, "a", [])}
+
+
+def test_cached_parse_reparses_racily_clean_file(tmp_path, submodules):
+    """A same-size edit within the cache write's timestamp is re-parsed, not served stale."""
+    cache_path = tmp_path / "cache" / "imports.json"
+    calls = []
+
+    with (
+        patch("pytest_impacted.graph.RUST_AVAILABLE", False),
+        patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse(calls)),
+    ):
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+
+        # Simulate an edit that lands on the cache file's timestamp without changing the size.
+        written_ns = os.stat(cache_path).st_mtime_ns
+        os.utime(submodules["pkg.core"], ns=(written_ns, written_ns))
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+
+    assert calls == [["pkg.core", "tests.test_core"], ["pkg.core"]]
+
+
+def test_load_cache_missing_file(tmp_path):
+    """A missing cache file yields no entries."""
+    assert _import_cache.load_cache(tmp_path / "missing.json", {}) == {}
+
+
+def test_cache_file_path_is_per_configuration(tmp_path):
+    """Different package/tests combinations use different cache files."""
+    assert _import_cache.cache_file_path(tmp_path, "pkg", None) != _import_cache.cache_file_path(
+        tmp_path, "pkg", "tests"
+    )
+
+
+def test_cached_parse_skips_unchanged_files(tmp_path, submodules):
+    """Only files whose stat signature changed are re-parsed on subsequent runs."""
+    cache_path = tmp_path / "cache" / "imports.json"
+    calls = []
+
+    with patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse(calls)):
+        first = graph._parse_all_module_imports_cached(submodules, cache_path)
+        second = graph._parse_all_module_imports_cached(submodules, cache_path)
+
+        core = submodules["pkg.core"]
+        with open(core, "a") as fh:
+            fh.write("import sys\n")
+        third = graph._parse_all_module_imports_cached(submodules, cache_path)
+
+    assert first == second == third == {"pkg.core": [], "tests.test_core": ["pkg.core"]}
+    assert calls == [["pkg.core", "tests.test_core"], ["pkg.core"]]
+
+
+def test_cached_parse_ignores_entry_for_renamed_module(tmp_path, submodules):
+    """A cached entry is only reused when the module name for the path is unchanged."""
+    cache_path = tmp_path / "imports.json"
+    calls = []
+
+    with patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse(calls)):
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+        # Pretend the path previously belonged to another module: relative-import
+        # resolution differs, so the entry must not be reused.
+        header = _import_cache.cache_header(submodules, backend="rust" if graph.RUST_AVAILABLE else "python")
+        data = json.loads(cache_path.read_text())
+        data["entries"][submodules["pkg.core"]][2] = "pkg.other"
+        data["header"] = header
+        cache_path.write_text(json.dumps(data))
+
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+
+    assert calls[1] == ["pkg.core"]
+
+
+def test_cached_parse_does_not_rewrite_unchanged_cache(tmp_path, submodules):
+    """A fully warm cache is not rewritten."""
+    cache_path = tmp_path / "imports.json"
+
+    with patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse([])):
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+        mtime_ns = os.stat(cache_path).st_mtime_ns
+        with patch("pytest_impacted._import_cache.save_cache") as mock_save:
+            graph._parse_all_module_imports_cached(submodules, cache_path)
+
+    mock_save.assert_not_called()
+    assert os.stat(cache_path).st_mtime_ns == mtime_ns
+
+
+def test_cached_parse_flushes_removed_files(tmp_path, submodules):
+    """Entries for files that left the package are dropped without re-parsing the rest."""
+    cache_path = tmp_path / "imports.json"
+    calls = []
+
+    with (
+        patch("pytest_impacted.graph.RUST_AVAILABLE", True),
+        patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse(calls)),
+    ):
+        graph._parse_all_module_imports_cached(submodules, cache_path)
+        remaining = {"pkg.core": submodules["pkg.core"]}
+        result = graph._parse_all_module_imports_cached(remaining, cache_path)
+
+    assert result == {"pkg.core": []}
+    assert calls == [["pkg.core", "tests.test_core"]]
+    assert list(json.loads(cache_path.read_text())["entries"]) == [submodules["pkg.core"]]
+
+
+def test_build_dep_tree_with_cache_dir(tmp_path, submodules):
+    """build_dep_tree produces the same graph with and without the on-disk cache."""
+    with (
+        patch("pytest_impacted.graph.discover_submodules", return_value=submodules),
+        patch("pytest_impacted.graph._parse_all_module_imports", side_effect=_fake_parse([])),
+    ):
+        uncached = graph.build_dep_tree("pkg")
+        cold = graph.build_dep_tree("pkg", cache_dir=tmp_path)
+        warm = graph.build_dep_tree("pkg", cache_dir=tmp_path)
+
+    assert set(uncached.edges) == set(cold.edges) == set(warm.edges) == {("pkg.core", "tests.test_core")}
+    assert list(tmp_path.glob("imports-*.json"))
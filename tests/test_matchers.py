@@ -1,6 +1,10 @@
 """Unit-tests for the matchers module."""
 
-from pytest_impacted.api import matches_impacted_tests
+import os
+
+import pytest
+
+from pytest_impacted.api import build_impacted_tests_index, matches_impacted_tests
 
 
 def test_matches_impacted_tests_positive():
@@ -19,3 +23,38 @@ def test_matches_impacted_tests_negative():
 def test_matches_impacted_tests_empty():
     """Test that matches_impacted_tests returns False if impacted_tests is empty."""
     assert not matches_impacted_tests("test_sample.py", impacted_tests=[])
+
+
+@pytest.mark.parametrize(
+    "item_path",
+    [
+        "test_sample.py",
+        "bar/test_sample.py",
+        "foo/bar/test_sample.py",
+        "/abs/foo/bar/test_sample.py",
+        "sample.py",
+        "ar/test_sample.py",
+        "test_other.py",
+        "",
+    ],
+)
+def test_impacted_tests_index_agrees_with_matches_impacted_tests(item_path):
+    """Index membership gives the same answer as matches_impacted_tests for every item path."""
+    impacted = [os.path.join("/abs", "foo", "bar", "test_sample.py"), os.path.join("foo", "test_unit.py")]
+    item_path = item_path.replace("/", os.sep)
+    index = build_impacted_tests_index(impacted)
+
+    assert (item_path in index) == matches_impacted_tests(item_path, impacted_tests=impacted)
+
+
+def test_impacted_tests_index_normalizes_impacted_paths():
+    """Redundant separators and dot segments in impacted paths do not prevent a match."""
+    impacted = [
+        os.sep.join(["foo", "bar", ".", "test_sample.py"]),
+        os.sep.join(["foo", "", "baz", "test_other.py"]),
+    ]
+    index = build_impacted_tests_index(impacted)
+
+    assert os.path.join("bar", "test_sample.py") in index
+    assert os.path.join("foo", "baz", "test_other.py") in index
+    assert "" not in index
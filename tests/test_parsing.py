@@ -1,14 +1,12 @@
 """Unit tests for the parsing module."""
 
-import tempfile
-
 import pytest
 
 from pytest_impacted import parsing
 
 
-def test_parse_file_imports():
-    """Test parse_file_imports with basic import statements."""
+def test_parse_source_imports():
+    """Test parse_source_imports with basic import statements."""
     source = """\
 import os
 import sys
@@ -16,20 +14,30 @@ from pathlib import Path
 from typing import List, Dict
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert set(imports) == {"os", "sys", "pathlib", "typing"}
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert set(imports) == {"os", "sys", "pathlib", "typing"}
+
+
+def test_parse_source_imports_empty_source():
+    """Test parse_source_imports with empty source."""
+    imports = parsing.parse_source_imports("", "mypkg.mymod")
+    assert imports == []
+
+
+def test_parse_file_imports_honours_coding_declaration(tmp_path):
+    """Sources are decoded by the parser, so PEP 263 coding declarations are respected."""
+    path = tmp_path / "latin.py"
+    path.write_bytes("# -*- coding: latin-1 -*-\nimport os\nNAME = 'caf\u00e9'\n".encode("latin-1"))
 
+    assert parsing.parse_file_imports(str(path), "mypkg.latin") == ["os"]
 
-def test_parse_file_imports_empty_source():
-    """Test parse_file_imports with an empty file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write("")
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert imports == []
+
+def test_parse_file_imports_undecodable_source(tmp_path):
+    """Sources that are not valid in their declared encoding yield no imports."""
+    path = tmp_path / "broken.py"
+    path.write_bytes(b"import os\nNAME = '\xff'\n")
+
+    assert parsing.parse_file_imports(str(path), "mypkg.broken") == []
 
 
 def test_parse_file_imports_nonexistent_file():
@@ -38,17 +46,16 @@ def test_parse_file_imports_nonexistent_file():
     assert imports == []
 
 
-def test_parse_file_imports_zero_byte_file():
+def test_parse_file_imports_zero_byte_file(tmp_path):
     """Test parse_file_imports gracefully handles zero-byte files."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        # Write nothing — file stays at 0 bytes
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert imports == []
+    path = tmp_path / "empty.py"
+    path.touch()
+    imports = parsing.parse_file_imports(str(path), "mypkg.mymod")
+    assert imports == []
 
 
-def test_parse_file_imports_from_statements():
-    """Test parse_file_imports with various from-import statement scenarios."""
+def test_parse_source_imports_from_statements():
+    """Test parse_source_imports with various from-import statement scenarios."""
     # Test importing a sub-module vs a symbol
     source = """\
 from pathlib import Path
@@ -56,11 +63,8 @@ from typing import List, Dict
 from os import path
 from sys import modules
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert set(imports) == {"pathlib", "typing", "os.path", "sys"}
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert set(imports) == {"pathlib", "typing", "os.path", "sys"}
 
     # Test importing non-module items
     source = """\
@@ -68,11 +72,8 @@ from datetime import datetime
 from collections import defaultdict
 from unittest.mock import patch
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert set(imports) == {"datetime", "collections", "unittest.mock"}
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert set(imports) == {"datetime", "collections", "unittest.mock"}
 
     # Test mixed imports
     source = """\
@@ -81,11 +82,8 @@ from pathlib import Path
 from typing import List, Dict
 from unittest.mock import patch
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert set(imports) == {"os", "pathlib", "typing", "unittest.mock"}
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert set(imports) == {"os", "pathlib", "typing", "unittest.mock"}
 
 
 @pytest.mark.parametrize(
@@ -103,6 +101,12 @@ from unittest.mock import patch
         # Non-test module names
         ("regular_module", False),
         ("package.module", False),
+        ("package.test_helpers.util", False),
+        ("package.my_test.util", False),
+        ("package.testing", False),
+        ("package.latest", False),
+        ("package.contest", False),
+        ("package.testsuite", False),
         # Edge cases
         ("test", True),
         ("tests", True),
@@ -140,8 +144,33 @@ def test_is_module_path(module_path, package, expected):
     assert parsing.is_module_path(module_path, package=package) is expected
 
 
-def test_parse_file_imports_nested_in_try_except():
-    """Test parse_file_imports finds imports inside try/except blocks."""
+def test_is_module_path_is_memoized_across_packages(monkeypatch):
+    """Absolute names are looked up once, whichever module asks about them."""
+    calls = []
+    real_find_spec = parsing.importlib.util.find_spec
+
+    def counting_find_spec(name, package=None):
+        calls.append((name, package))
+        return real_find_spec(name, package)
+
+    parsing.clear_module_path_cache()
+    monkeypatch.setattr(parsing.importlib.util, "find_spec", counting_find_spec)
+    try:
+        assert parsing.is_module_path("os.path", package="pkg.a") is True
+        assert parsing.is_module_path("os.path", package="pkg.b") is True
+        assert parsing.is_module_path("os.nonexistent", package="pkg.a") is False
+        assert parsing.is_module_path("os.nonexistent", package="pkg.b") is False
+        assert calls == [("os.path", None), ("os.nonexistent", None)]
+
+        parsing.clear_module_path_cache()
+        parsing.is_module_path("os.path")
+        assert len(calls) == 3
+    finally:
+        parsing.clear_module_path_cache()
+
+
+def test_parse_source_imports_nested_in_try_except():
+    """Test parse_source_imports finds imports inside try/except blocks."""
     source = """\
 import os
 
@@ -151,17 +180,14 @@ except ImportError:
     import json
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert "os" in imports
-        assert "ujson" in imports
-        assert "json" in imports
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert "os" in imports
+    assert "ujson" in imports
+    assert "json" in imports
 
 
-def test_parse_file_imports_nested_in_if_block():
-    """Test parse_file_imports finds imports inside if-guards."""
+def test_parse_source_imports_nested_in_if_block():
+    """Test parse_source_imports finds imports inside if-guards."""
     source = """\
 import sys
 
@@ -171,40 +197,34 @@ else:
     from tomli import loads
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.mymod")
-        assert "sys" in imports
-        assert "tomllib" in imports
-        assert "tomli" in imports
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert "sys" in imports
+    assert "tomllib" in imports
+    assert "tomli" in imports
 
 
-def test_parse_file_imports_with_relative_imports():
-    """Test parse_file_imports with relative imports to verify proper package resolution."""
+def test_parse_source_imports_with_relative_imports():
+    """Test parse_source_imports with relative imports to verify proper package resolution."""
     source = """\
 from .models.b import Something
 from . import utils
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        # Module is my_package.a, so relative imports resolve against my_package
-        imports = parsing.parse_file_imports(f.name, "my_package.a")
+    # Module is my_package.a, so relative imports resolve against my_package
+    imports = parsing.parse_source_imports(source, "my_package.a")
 
-        # from .models.b should resolve to my_package.models.b
-        assert "my_package.models.b" in imports
-        # from . import utils should resolve to my_package
-        assert "my_package" in imports
+    # from .models.b should resolve to my_package.models.b
+    assert "my_package.models.b" in imports
+    # from . import utils should resolve to my_package
+    assert "my_package" in imports
 
-        # These unresolved paths should NOT be in the imports
-        assert "models.b" not in imports
-        assert "" not in imports
+    # These unresolved paths should NOT be in the imports
+    assert "models.b" not in imports
+    assert "" not in imports
 
 
-def test_parse_file_imports_with_complex_relative_imports():
-    """Test parse_file_imports with various levels of relative imports."""
+def test_parse_source_imports_with_complex_relative_imports():
+    """Test parse_source_imports with various levels of relative imports."""
     source = """\
 from . import sibling_module
 from .sibling import SomeClass
@@ -212,36 +232,97 @@ from ..parent_level import something
 from ...root_level import another
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        # Module is my_package.subpackage.module
-        imports = parsing.parse_file_imports(f.name, "my_package.subpackage.module")
-
-        # from . import sibling_module -> my_package.subpackage
-        assert "my_package.subpackage" in imports
-        # from .sibling -> my_package.subpackage.sibling
-        assert "my_package.subpackage.sibling" in imports
-        # from ..parent_level -> my_package.parent_level
-        assert "my_package.parent_level" in imports
-        # from ...root_level -> root_level (goes up to root)
-        assert "root_level" in imports
-
-        # These should NOT be in imports
-        assert "sibling" not in imports
-        assert "parent_level" not in imports
-        assert "" not in imports
-
-
-def test_parse_file_imports_syntax_error():
-    """Test parse_file_imports gracefully handles files with syntax errors."""
+    # Module is my_package.subpackage.module
+    imports = parsing.parse_source_imports(source, "my_package.subpackage.module")
+
+    # from . import sibling_module -> my_package.subpackage
+    assert "my_package.subpackage" in imports
+    # from .sibling -> my_package.subpackage.sibling
+    assert "my_package.subpackage.sibling" in imports
+    # from ..parent_level -> my_package.parent_level
+    assert "my_package.parent_level" in imports
+    # from ...root_level -> root_level (goes up to root)
+    assert "root_level" in imports
+
+    # These should NOT be in imports
+    assert "sibling" not in imports
+    assert "parent_level" not in imports
+    assert "" not in imports
+
+
+def test_parse_source_imports_syntax_error():
+    """Test parse_source_imports gracefully handles sources with syntax errors."""
     source = """\
 import os
 def broken(
 """
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(source)
-        f.flush()
-        imports = parsing.parse_file_imports(f.name, "mypkg.broken")
-        assert imports == []
+    imports = parsing.parse_source_imports(source, "mypkg.broken")
+    assert imports == []
+
+
+def test_parse_source_imports_nested_in_function_and_class():
+    """Test parse_source_imports finds deferred imports inside functions, methods and classes."""
+    source = """\
+def load():
+    import csv
+    return csv
+
+
+class Loader:
+    import io
+
+    async def run(self):
+        from collections import abc
+        with open(__file__) as fh:
+            import shlex
+"""
+
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert imports == ["collections.abc", "csv", "io", "shlex"]
+
+
+def test_parse_source_imports_nested_in_loops_and_match():
+    """Test parse_source_imports finds imports in loop, else, finally and match-case bodies."""
+    source = """\
+for _ in range(1):
+    import csv
+else:
+    import io
+
+while False:
+    import shlex
+
+try:
+    pass
+finally:
+    import json
+
+match 1:
+    case 1:
+        import string
+"""
+
+    imports = parsing.parse_source_imports(source, "mypkg.mymod")
+    assert imports == ["csv", "io", "json", "shlex", "string"]
+
+
+def test_parse_file_imports_skips_parsing_without_import_keyword(tmp_path, monkeypatch):
+    """Files that never mention ``import`` are not handed to the AST parser."""
+    path = tmp_path / "constants.py"
+    path.write_text("VALUE = 1\n\n\ndef double(x):\n    return 2 * x\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ast.parse should not be called")
+
+    monkeypatch.setattr(parsing.ast, "parse", fail)
+
+    assert parsing.parse_file_imports(str(path), "mypkg.constants") == []
+
+
+def test_parse_imports_task(tmp_path):
+    """The worker-process entry point returns the module name with its parsed imports."""
+    path = tmp_path / "__init__.py"
+    path.write_text("import os\nimport json\n")
+
+    assert parsing.parse_imports_task(("pkg", str(path), True)) == ("pkg", ["json", "os"])
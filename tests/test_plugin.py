@@ -1,10 +1,16 @@
-from unittest.mock import MagicMock
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from pytest_impacted.git import GitMode
 from pytest_impacted.plugin import (
+    _OPTION_NAMES,
+    _OPTIONS_KEY,
+    _impacted_options,
     pytest_addoption,
+    pytest_collection_modifyitems,
     pytest_configure,
     pytest_report_header,
     validate_base_branch,
@@ -23,6 +29,7 @@ def cli_options():
         "impacted_base_branch",
         "impacted_tests_dir",
         "no_impacted_dep_files",
+        "no_impacted_cache",
     ]
 
 
@@ -191,3 +198,82 @@ def testvalidate_module_src_layout_suggestion(tmp_path, monkeypatch):
 
     with pytest.raises(pytest.UsageError, match="--impacted-module=src/mypackage"):
         validate_module("mypackage")
+
+
+def test_pytest_configure_skips_validation_when_disabled(pytestconfig, monkeypatch):
+    """Validation is skipped entirely unless --impacted is enabled."""
+    monkeypatch.setattr(pytestconfig.option, "impacted", None)
+    mock_validate = MagicMock()
+    monkeypatch.setattr("pytest_impacted.plugin.validate_config", mock_validate)
+
+    pytest_configure(pytestconfig)
+
+    mock_validate.assert_not_called()
+
+
+def test_impacted_options_reuse_configure_snapshot():
+    """Hooks read the options snapshot taken in pytest_configure instead of re-resolving them."""
+    config = MagicMock()
+    config.stash = pytest.Stash()
+    config.getoption.side_effect = lambda name: {"impacted": True, "impacted_module": "pkg"}.get(name)
+    config.getini.return_value = None
+
+    with patch("pytest_impacted.plugin.validate_config"):
+        pytest_configure(config)
+    calls = config.getoption.call_count
+
+    options = _impacted_options(config)
+    _impacted_options(config)
+
+    assert options["impacted"] is True
+    assert options["impacted_module"] == "pkg"
+    assert config.getoption.call_count == calls
+
+
+def test_pytest_configure_resolves_each_option_once():
+    """Validation reuses the options resolved for the snapshot rather than reading them again."""
+    config = MagicMock()
+    config.stash = pytest.Stash()
+    values = {"impacted": True, "impacted_module": "pkg", "impacted_git_mode": GitMode.UNSTAGED}
+    config.getoption.side_effect = values.get
+    config.getini.return_value = None
+
+    with patch("pytest_impacted.plugin.validate_module") as mock_validate_module:
+        pytest_configure(config)
+
+    mock_validate_module.assert_called_once_with("pkg")
+    assert sorted(call.args[0] for call in config.getoption.call_args_list) == sorted(_OPTION_NAMES)
+
+
+@pytest.mark.parametrize("no_cache", [None, True])
+def test_collection_modifyitems_import_cache_opt_out(tmp_path, no_cache):
+    """The import cache lives in pytest's cache directory unless --no-impacted-cache is given."""
+    config = MagicMock()
+    config.stash = pytest.Stash()
+    config.stash[_OPTIONS_KEY] = {
+        "impacted": True,
+        "impacted_module": "pkg",
+        "impacted_git_mode": GitMode.UNSTAGED,
+        "no_impacted_cache": no_cache,
+    }
+    config.cache.mkdir.return_value = tmp_path
+
+    with (
+        patch("pytest_impacted.plugin.build_strategy_with_extensions"),
+        patch("pytest_impacted.plugin._collect_ext_config", return_value={}),
+        patch("pytest_impacted.api.get_impacted_tests", return_value=[]) as mock_get,
+    ):
+        pytest_collection_modifyitems(MagicMock(), config, [])
+
+    assert mock_get.call_args.kwargs["cache_dir"] == (None if no_cache else tmp_path)
+
+
+def test_plugin_import_does_not_load_analysis_modules():
+    """Loading the plugin (as pytest does on every run) must not import NetworkX or GitPython."""
+    code = (
+        "import sys, pytest_impacted.plugin; "
+        "print(sorted(m for m in ('git', 'networkx', 'pytest_impacted.graph') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
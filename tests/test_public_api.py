@@ -7,6 +7,8 @@ matching CLAUDE.md / README / docs/usage.md entries in the same commit.
 
 from __future__ import annotations
 
+import pytest
+
 import pytest_impacted
 from pytest_impacted.parsing import parse_file_imports as _canonical_parse_file_imports
 from pytest_impacted.traversal import discover_submodules as _canonical_discover_submodules
@@ -40,3 +42,12 @@ def test_discover_submodules_is_the_canonical_traversal_helper():
 
 def test_parse_file_imports_is_the_canonical_parsing_helper():
     assert pytest_impacted.parse_file_imports is _canonical_parse_file_imports
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'not_a_public_name'"):
+        pytest_impacted.not_a_public_name  # noqa: B018
+
+
+def test_dir_lists_public_api():
+    assert EXPECTED_PUBLIC_API.issubset(dir(pytest_impacted))
@@ -1,8 +1,10 @@
 """Tests for the traversal module."""
 
 import importlib
+import inspect
 import os
 import pkgutil
+import sys
 from pathlib import Path
 
 import pytest
@@ -19,11 +21,29 @@ from pytest_impacted.traversal import (
 )
 
 
-def test_package_name_to_path():
+@pytest.fixture(scope="session")
+def pytest_impacted_pkg():
+    """The pytest_impacted package module, imported once per session."""
+    return importlib.import_module("pytest_impacted")
+
+
+@pytest.fixture(scope="session")
+def pytest_impacted_path(pytest_impacted_pkg):
+    """Directory of the pytest_impacted package."""
+    return Path(pytest_impacted_pkg.__path__[0])
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("simple", "simple"),
+        ("nested.package", "nested/package"),
+        ("deeply.nested.package", "deeply/nested/package"),
+    ],
+)
+def test_package_name_to_path(name, expected):
     """Test the package_name_to_path helper function."""
-    assert package_name_to_path("simple") == "simple"
-    assert package_name_to_path("nested.package") == "nested/package"
-    assert package_name_to_path("deeply.nested.package") == "deeply/nested/package"
+    assert package_name_to_path(name) == expected
 
 
 def test_iter_namespace_with_string():
@@ -39,12 +59,15 @@ def test_iter_namespace_with_string():
     # All module names should start with the original package name
     assert all(m.name.startswith("pytest_impacted.") for m in modules)
 
+    # And the entries are exactly those pkgutil reports for the converted path.
+    expected = [(m.name, m.ispkg) for m in pkgutil.iter_modules(["pytest_impacted"], prefix="pytest_impacted.")]
+    assert [(m.name, m.ispkg) for m in modules] == expected
 
-def test_iter_namespace_with_module():
+
+def test_iter_namespace_with_module(pytest_impacted_pkg):
     """Test iter_namespace with module input."""
     # Test with a known package
-    package = importlib.import_module("pytest_impacted")
-    modules = list(iter_namespace(package))
+    modules = list(iter_namespace(pytest_impacted_pkg))
     assert len(modules) > 0
     # pkgutil.iter_modules returns ModuleInfo objects, not ModuleType
     assert all(hasattr(m, "name") for m in modules)
@@ -61,10 +84,9 @@ def test_discover_submodules():
     assert modules["pytest_impacted.traversal"].endswith("traversal.py")
 
 
-def test_resolve_files_to_modules():
+def test_resolve_files_to_modules(pytest_impacted_path):
     """Test resolve_files_to_modules function."""
-    package_path = Path(importlib.import_module("pytest_impacted").__path__[0])
-    test_file = str(package_path / "traversal.py")
+    test_file = str(pytest_impacted_path / "traversal.py")
     modules = resolve_files_to_modules([test_file], "pytest_impacted")
     assert len(modules) == 1
     assert modules[0] == "pytest_impacted.traversal"
@@ -132,31 +154,72 @@ def test_iter_namespace_invalid_input():
         list(iter_namespace(123))  # type: ignore
 
 
-def test_discover_submodules_skips_missing_files():
-    """Test discover_submodules skips modules whose files don't exist on disk."""
-    traversal.discover_submodules.cache_clear()
-    with pytest.MonkeyPatch.context() as m:
+def test_discover_submodules_skips_non_module_entries(tmp_path, monkeypatch):
+    """Only entries pkgutil.iter_modules would report as modules are discovered."""
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").touch()
+    (pkg / "real.py").touch()
+    (pkg / "dotted.name.py").touch()
+    (pkg / "notes.txt").touch()
+    (pkg / "dir.with.dot").mkdir()
+    (pkg / "dir.with.dot" / "__init__.py").touch()
+    (pkg / "fake.py").mkdir()
+    (pkg / "__pycache__").mkdir()
+    (pkg / "__pycache__" / "cached.py").touch()
 
-        def mock_iter_namespace(package, *, scan_path=None):
-            return [pkgutil.ModuleInfo(None, "nonexistent.module", False)]
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
 
-        m.setattr("pytest_impacted.traversal.iter_namespace", mock_iter_namespace)
+    assert discover_submodules("pkg") == {"pkg.real": str(pkg / "real.py")}
 
-        modules = discover_submodules("some_package")
-        # Module file won't exist on disk, so it should be skipped
-        assert "nonexistent.module" not in modules
 
+def test_discover_submodules_package_shadows_module(tmp_path, monkeypatch):
+    """A package directory takes precedence over a same-named .py file."""
+    pkg = tmp_path / "pkg"
+    (pkg / "thing").mkdir(parents=True)
+    (pkg / "__init__.py").touch()
+    (pkg / "thing.py").touch()
+    (pkg / "thing" / "__init__.py").touch()
+    (pkg / "thing" / "deep.py").touch()
 
-def test_resolve_files_to_modules_edge_cases():
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    modules = discover_submodules("pkg")
+    assert modules == {
+        "pkg.thing": str(pkg / "thing" / "__init__.py"),
+        "pkg.thing.deep": str(pkg / "thing" / "deep.py"),
+    }
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        # Empty file list.
+        [],
+        # Non-Python file.
+        ["test.txt"],
+        # File outside the package.
+        ["/tmp/test.py"],
+    ],
+)
+def test_resolve_files_to_modules_edge_cases(files):
     """Test resolve_files_to_modules with various edge cases."""
-    # Test with empty file list
-    assert resolve_files_to_modules([], "pytest_impacted") == []
+    assert resolve_files_to_modules(files, "pytest_impacted") == []
 
-    # Test with non-Python file
-    assert resolve_files_to_modules(["test.txt"], "pytest_impacted") == []
 
-    # Test with file outside package
-    assert resolve_files_to_modules(["/tmp/test.py"], "pytest_impacted") == []
+def test_resolve_without_candidates_skips_discovery(monkeypatch):
+    """Inputs that cannot match anything are answered without scanning the package."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("discover_submodules should not be called")
+
+    monkeypatch.setattr(traversal, "discover_submodules", fail)
+
+    assert resolve_files_to_modules([], "pytest_impacted") == []
+    assert resolve_files_to_modules(["README.md", "uv.lock"], "pytest_impacted", "tests") == []
+    assert resolve_modules_to_files([], "pytest_impacted", "tests") == []
 
 
 def test_resolve_modules_to_files_edge_cases():
@@ -171,12 +234,14 @@ def test_resolve_modules_to_files_edge_cases():
     assert all(isinstance(f, str) for f in files)
 
 
-def test_discover_submodules_empty(monkeypatch):
+def test_discover_submodules_empty(tmp_path, monkeypatch):
     """Test discover_submodules for a package with no submodules."""
+    (tmp_path / "some_package").mkdir()
+    (tmp_path / "some_package" / "__init__.py").touch()
+    monkeypatch.chdir(tmp_path)
     traversal.discover_submodules.cache_clear()
-    monkeypatch.setattr("pytest_impacted.traversal.iter_namespace", lambda pkg, **kwargs: [])
-    result = discover_submodules("some_package")
-    assert result == {}
+    assert discover_submodules("some_package") == {}
+    assert discover_submodules("missing_package") == {}
 
 
 def test_iter_namespace_module_without_path(monkeypatch):
@@ -190,58 +255,85 @@ def test_iter_namespace_module_without_path(monkeypatch):
         list(iter_namespace(dummy))
 
 
-def test_resolve_files_to_modules_with_tests_package():
+@pytest.fixture
+def mock_discover(monkeypatch):
+    """Install a fake discover_submodules serving fixed ``{package: {module: path}}`` results."""
+
+    def _install(submodules_by_package):
+        monkeypatch.setattr(
+            traversal, "discover_submodules", lambda package, **kwargs: submodules_by_package.get(package, {})
+        )
+
+    return _install
+
+
+def test_resolve_files_to_modules_with_tests_package(mock_discover):
     """Test resolve_files_to_modules with tests_package parameter."""
-    with pytest.MonkeyPatch.context() as m:
-        # Mock discover_submodules to return known results (name -> abs filepath)
-        def mock_discover_submodules(package, **kwargs):
-            if package == "pytest_impacted":
-                return {"pytest_impacted.traversal": "/path/to/pytest_impacted/traversal.py"}
-            elif package == "tests":
-                return {"tests.test_traversal": "/path/to/tests/test_traversal.py"}
-            return {}
-
-        m.setattr("pytest_impacted.traversal.discover_submodules", mock_discover_submodules)
-
-        # Test with a file from the main package
-        main_file = "/path/to/pytest_impacted/traversal.py"
-        modules = resolve_files_to_modules([main_file], "pytest_impacted", "tests")
-        assert len(modules) == 1
-        assert modules[0] == "pytest_impacted.traversal"
+    mock_discover(
+        {
+            "pytest_impacted": {"pytest_impacted.traversal": "/path/to/pytest_impacted/traversal.py"},
+            "tests": {"tests.test_traversal": "/path/to/tests/test_traversal.py"},
+        }
+    )
+
+    # Test with a file from the main package
+    main_file = "/path/to/pytest_impacted/traversal.py"
+    modules = resolve_files_to_modules([main_file], "pytest_impacted", "tests")
+    assert len(modules) == 1
+    assert modules[0] == "pytest_impacted.traversal"
 
-        # Test with a file from the tests package
-        test_file = "/path/to/tests/test_traversal.py"
-        modules = resolve_files_to_modules([test_file], "pytest_impacted", "tests")
-        assert len(modules) == 1
-        assert modules[0] == "tests.test_traversal"
+    # Test with a file from the tests package
+    test_file = "/path/to/tests/test_traversal.py"
+    modules = resolve_files_to_modules([test_file], "pytest_impacted", "tests")
+    assert len(modules) == 1
+    assert modules[0] == "tests.test_traversal"
 
 
-def test_resolve_files_to_modules_init_file():
-    """Test resolve_files_to_modules with __init__.py files."""
-    with pytest.MonkeyPatch.context() as m:
+def test_module_index_reused_until_discovery_cache_cleared(tmp_path, monkeypatch):
+    """The module index is memoized, but follows discover_submodules cache invalidation."""
+    (tmp_path / "mappkg").mkdir()
+    (tmp_path / "mappkg" / "__init__.py").touch()
+    (tmp_path / "mappkg" / "a.py").touch()
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    first = traversal._module_index("mappkg")
+    assert traversal._module_index("mappkg") is first
+    assert resolve_files_to_modules(["mappkg/b.py"], "mappkg") == []
+    assert resolve_modules_to_files(["mappkg.a"], "mappkg") == [first[0]["mappkg.a"]]
+
+    (tmp_path / "mappkg" / "b.py").touch()
+    discover_submodules.cache_clear()
 
-        def mock_discover_submodules(package, **kwargs):
-            return {"mypkg": "/project/mypkg/__init__.py"}
+    assert traversal._module_index("mappkg") is not first
+    assert resolve_files_to_modules(["mappkg/b.py"], "mappkg") == ["mappkg.b"]
+    assert resolve_modules_to_files(["mappkg.b"], "mappkg") == [str(tmp_path / "mappkg" / "b.py")]
 
-        m.setattr("pytest_impacted.traversal.discover_submodules", mock_discover_submodules)
 
-        modules = resolve_files_to_modules(["/project/mypkg/__init__.py"], "mypkg")
-        assert modules == ["mypkg"]
+def test_resolve_files_to_modules_init_file(mock_discover):
+    """Test resolve_files_to_modules with __init__.py files."""
+    mock_discover({"mypkg": {"mypkg": "/project/mypkg/__init__.py"}})
+
+    modules = resolve_files_to_modules(["/project/mypkg/__init__.py"], "mypkg")
+    assert modules == ["mypkg"]
 
 
-def test_resolve_files_to_modules_relative_git_path():
+def test_resolve_files_to_modules_relative_git_path(mock_discover):
     """Test resolve_files_to_modules with relative git paths (e.g. 'pytest_impacted/foo.py')."""
-    with pytest.MonkeyPatch.context() as m:
+    # The absolute path must match what os.path.abspath("mypkg/foo.py") resolves to
+    mock_discover({"mypkg": {"mypkg.foo": os.path.abspath("mypkg/foo.py")}})
 
-        def mock_discover_submodules(package, **kwargs):
-            # The absolute path must match what os.path.abspath("mypkg/foo.py") resolves to
-            return {"mypkg.foo": os.path.abspath("mypkg/foo.py")}
+    # Relative path from git that doesn't match the absolute package path
+    modules = resolve_files_to_modules(["mypkg/foo.py"], "mypkg")
+    assert modules == ["mypkg.foo"]
 
-        m.setattr("pytest_impacted.traversal.discover_submodules", mock_discover_submodules)
 
-        # Relative path from git that doesn't match the absolute package path
-        modules = resolve_files_to_modules(["mypkg/foo.py"], "mypkg")
-        assert modules == ["mypkg.foo"]
+def test_resolve_files_to_modules_normalizes_like_abspath(mock_discover):
+    """Relative, dotted and absolute spellings of a path all resolve as os.path.abspath would."""
+    mock_discover({"mypkg": {"mypkg.foo": os.path.abspath("mypkg/foo.py")}})
+
+    files = ["./mypkg/foo.py", "mypkg/sub/../foo.py", os.path.abspath("mypkg/foo.py")]
+    assert resolve_files_to_modules(files, "mypkg") == ["mypkg.foo"] * 3
 
 
 def test_discover_submodules_without_init_in_subdirectory(tmp_path, monkeypatch):
@@ -274,6 +366,38 @@ def test_discover_submodules_without_init_in_ancestor_directory(tmp_path, monkey
     assert "tests.app.unit.test_core" in modules
 
 
+def test_discover_submodules_filesystem_matches_rglob(tmp_path, monkeypatch):
+    """The scandir walk finds what Path.rglob finds, with symlinked files resolved and symlinked dirs skipped."""
+    tests_dir = tmp_path / "tests"
+    (tests_dir / "unit" / "deep").mkdir(parents=True)
+    (tests_dir / "__init__.py").touch()
+    (tests_dir / "conftest.py").touch()
+    (tests_dir / "unit" / "test_a.py").touch()
+    (tests_dir / "unit" / "deep" / "__init__.py").touch()
+    (tests_dir / "unit" / "deep" / "test_b.py").touch()
+    (tests_dir / "unit" / "notes.txt").touch()
+    (tmp_path / "shared.py").touch()
+    (tests_dir / "test_linked.py").symlink_to(tmp_path / "shared.py")
+    (tmp_path / "elsewhere").mkdir()
+    (tmp_path / "elsewhere" / "test_outside.py").touch()
+    (tests_dir / "linked_dir").symlink_to(tmp_path / "elsewhere", target_is_directory=True)
+
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    modules = discover_submodules("tests", require_init=False)
+
+    base = os.path.realpath(tests_dir)
+    assert modules == {
+        "tests": os.path.join(base, "__init__.py"),
+        "tests.conftest": os.path.join(base, "conftest.py"),
+        "tests.test_linked": os.path.realpath(tmp_path / "shared.py"),
+        "tests.unit.test_a": os.path.join(base, "unit", "test_a.py"),
+        "tests.unit.deep": os.path.join(base, "unit", "deep", "__init__.py"),
+        "tests.unit.deep.test_b": os.path.join(base, "unit", "deep", "test_b.py"),
+    }
+
+
 def test_discover_submodules_require_init_skips_no_init_dirs(tmp_path, monkeypatch):
     """With require_init=True, directories without __init__.py should be skipped."""
     (tmp_path / "pkg").mkdir()
@@ -422,3 +546,102 @@ def test_iter_namespace_with_scan_path(tmp_path, monkeypatch):
     assert "pkg.mod" in names
     # Should NOT have "src.pkg.mod"
     assert all(not n.startswith("src.") for n in names)
+
+
+def test_discover_submodules_interns_module_names(tmp_path, monkeypatch):
+    """Discovered module names are interned so every structure built from them shares one string."""
+    (tmp_path / "internpkg").mkdir()
+    (tmp_path / "internpkg" / "__init__.py").touch()
+    (tmp_path / "internpkg" / "mod.py").touch()
+
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    for require_init in (True, False):
+        names = discover_submodules("internpkg", require_init=require_init)
+        assert names
+        assert all(sys.intern(name) is name for name in names)
+
+
+def test_discover_submodules_rescans_when_root_changes(tmp_path, monkeypatch):
+    """The discovery cache is keyed on the package root's mtime, so new modules are picked up."""
+    root = tmp_path / "mtimepkg"
+    root.mkdir()
+    (root / "__init__.py").touch()
+    (root / "a.py").touch()
+
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    first = discover_submodules("mtimepkg")
+    assert discover_submodules("mtimepkg") is first
+    assert discover_submodules.cache_info().hits == 1
+
+    (root / "b.py").touch()
+    stat = os.stat(root)
+    os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = discover_submodules("mtimepkg")
+    assert second is not first
+    assert set(second) == {"mtimepkg.a", "mtimepkg.b"}
+
+
+@pytest.mark.parametrize(
+    "require_init,new_file,expected",
+    [
+        # A module added inside an existing sub-package.
+        (True, "sub/b.py", "nestedpkg.sub.b"),
+        # A plain directory becoming a package by gaining an __init__.py.
+        (True, "plain/__init__.py", "nestedpkg.plain"),
+        # A test file added to a directory that previously held no modules at all.
+        (False, "plain/test_c.py", "nestedpkg.plain.test_c"),
+    ],
+)
+def test_discover_submodules_rescans_when_nested_directory_changes(
+    tmp_path, monkeypatch, require_init, new_file, expected
+):
+    """Changes below the root invalidate the cache too, without touching the root's mtime."""
+    root = tmp_path / "nestedpkg"
+    (root / "sub").mkdir(parents=True)
+    (root / "plain").mkdir()
+    (root / "__init__.py").touch()
+    (root / "sub" / "__init__.py").touch()
+    (root / "sub" / "a.py").touch()
+
+    monkeypatch.chdir(tmp_path)
+    discover_submodules.cache_clear()
+
+    first = discover_submodules("nestedpkg", require_init=require_init)
+    assert expected not in first
+    root_mtime_ns = os.stat(root).st_mtime_ns
+
+    (root / new_file).touch()
+    stat = os.stat((root / new_file).parent)
+    os.utime((root / new_file).parent, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = discover_submodules("nestedpkg", require_init=require_init)
+    assert os.stat(root).st_mtime_ns == root_mtime_ns
+    assert second is not first
+    assert expected in second
+    assert discover_submodules("nestedpkg", require_init=require_init) is second
+
+
+def test_discover_submodules_public_signature():
+    """The cache wrapper exposes the plain public signature, without the scanner's stamp list."""
+    assert list(inspect.signature(discover_submodules).parameters) == ["package", "require_init"]
+    assert discover_submodules.__doc__.startswith("Discover all submodules by filesystem scanning")
+
+
+def test_discover_submodules_cache_is_per_working_directory(tmp_path, monkeypatch):
+    """Relative package names are cached per resolved directory, not per name alone."""
+    for project, module in (("one", "a"), ("two", "b")):
+        pkg = tmp_path / project / "cwdpkg"
+        pkg.mkdir(parents=True)
+        (pkg / "__init__.py").touch()
+        (pkg / f"{module}.py").touch()
+
+    discover_submodules.cache_clear()
+    monkeypatch.chdir(tmp_path / "one")
+    assert set(discover_submodules("cwdpkg")) == {"cwdpkg.a"}
+    monkeypatch.chdir(tmp_path / "two")
+    assert set(discover_submodules("cwdpkg")) == {"cwdpkg.b"}